@@ -0,0 +1,87 @@
+# backend/alembic/versions/0001_skill_anchor_and_evaluation_runs.py
+"""skill anchor and evaluation runs
+
+Brings databases created by Base.metadata.create_all before these columns
+existed up to date. Every step is skipped when its target already exists,
+so the revision is safe on fresh databases too.
+
+Revision ID: 0001
+Revises:
+Create Date: 2026-10-18
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# Concurrent check-then-insert writes could leave several rows per
+# (user_id, skill_name); keep the most recently updated one.
+DELETE_DUPLICATE_SKILLS = """
+DELETE FROM skills WHERE id NOT IN (
+    SELECT id FROM (
+        SELECT id, ROW_NUMBER() OVER (
+            PARTITION BY user_id, skill_name
+            ORDER BY (updated_at IS NULL), updated_at DESC, id DESC
+        ) AS position
+        FROM skills
+    ) ranked
+    WHERE position = 1
+)
+"""
+
+revision = "0001"
+down_revision = None
+branch_labels = None
+depends_on = None
+
+def upgrade():
+    inspector = sa.inspect(op.get_bind())
+    tables = inspector.get_table_names()
+    if "skills" not in tables:
+        # Empty database: create_all builds the current schema on startup.
+        return
+    
+    if "evaluation_runs" not in tables:
+        op.create_table(
+            "evaluation_runs",
+            sa.Column("id", sa.Integer, primary_key=True),
+            sa.Column("run_key", sa.String),
+            sa.Column("status", sa.String),
+            sa.Column("users_evaluated", sa.Integer),
+            sa.Column("dispatched_at", sa.DateTime, nullable=True),
+            sa.Column("started_at", sa.DateTime),
+            sa.Column("finished_at", sa.DateTime, nullable=True)
+        )
+        op.create_index("ix_evaluation_runs_id", "evaluation_runs", ["id"])
+        op.create_index("ix_evaluation_runs_run_key", "evaluation_runs", ["run_key"], unique=True)
+    
+    skill_columns = {c["name"] for c in inspector.get_columns("skills")}
+    skill_uniques = {u["name"] for u in inspector.get_unique_constraints("skills")}
+    if "uq_skills_user_skill" not in skill_uniques:
+        op.execute(DELETE_DUPLICATE_SKILLS)
+    with op.batch_alter_table("skills") as batch:
+        if "level_anchor_at" not in skill_columns:
+            batch.add_column(sa.Column("level_anchor_at", sa.DateTime, nullable=True))
+        if "uq_skills_user_skill" not in skill_uniques:
+            batch.create_unique_constraint("uq_skills_user_skill", ["user_id", "skill_name"])
+    
+    evaluation_columns = {c["name"] for c in inspector.get_columns("evaluations")}
+    evaluation_uniques = {u["name"] for u in inspector.get_unique_constraints("evaluations")}
+    with op.batch_alter_table("evaluations") as batch:
+        if "run_id" not in evaluation_columns:
+            batch.add_column(sa.Column("run_id", sa.Integer, nullable=True))
+            batch.create_foreign_key(
+                "fk_evaluations_run_id", "evaluation_runs", ["run_id"], ["id"]
+            )
+        if "uq_evaluations_user_run" not in evaluation_uniques:
+            batch.create_unique_constraint("uq_evaluations_user_run", ["user_id", "run_id"])
+
+def downgrade():
+    with op.batch_alter_table("evaluations") as batch:
+        batch.drop_constraint("uq_evaluations_user_run", type_="unique")
+        batch.drop_constraint("fk_evaluations_run_id", type_="foreignkey")
+        batch.drop_column("run_id")
+    
+    with op.batch_alter_table("skills") as batch:
+        batch.drop_constraint("uq_skills_user_skill", type_="unique")
+        batch.drop_column("level_anchor_at")
+    
+    op.drop_table("evaluation_runs")
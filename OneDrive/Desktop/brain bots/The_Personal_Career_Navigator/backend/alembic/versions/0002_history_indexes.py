@@ -0,0 +1,30 @@
+# backend/alembic/versions/0002_history_indexes.py
+"""composite indexes for per-user history reads
+
+Revision ID: 0002
+Revises: 0001
+Create Date: 2026-10-18
+"""
+from alembic import op
+import sqlalchemy as sa
+
+revision = "0002"
+down_revision = "0001"
+branch_labels = None
+depends_on = None
+
+INDEXES = [
+    ("ix_evaluations_user_created", "evaluations", ["user_id", "created_at"]),
+    ("ix_roadmaps_user_status_created", "roadmaps", ["user_id", "status", "created_at"]),
+]
+
+def upgrade():
+    if "skills" not in sa.inspect(op.get_bind()).get_table_names():
+        return
+    
+    for name, table, columns in INDEXES:
+        op.create_index(name, table, columns, if_not_exists=True)
+
+def downgrade():
+    for name, table, _ in INDEXES:
+        op.drop_index(name, table_name=table, if_exists=True)
@@ -0,0 +1,34 @@
+# backend/alembic/versions/0003_pipeline_stage_results.py
+"""memoized pipeline stage outputs
+
+Revision ID: 0003
+Revises: 0002
+Create Date: 2026-10-18
+"""
+from alembic import op
+import sqlalchemy as sa
+
+revision = "0003"
+down_revision = "0002"
+branch_labels = None
+depends_on = None
+
+def upgrade():
+    tables = sa.inspect(op.get_bind()).get_table_names()
+    if "skills" not in tables or "pipeline_stage_results" in tables:
+        return
+    
+    op.create_table(
+        "pipeline_stage_results",
+        sa.Column("id", sa.Integer, primary_key=True),
+        sa.Column("user_id", sa.Integer, sa.ForeignKey("users.id")),
+        sa.Column("stage", sa.String),
+        sa.Column("fingerprint", sa.String),
+        sa.Column("output", sa.JSON),
+        sa.Column("updated_at", sa.DateTime),
+        sa.UniqueConstraint("user_id", "stage", name="uq_pipeline_stage_results_user_stage")
+    )
+    op.create_index("ix_pipeline_stage_results_id", "pipeline_stage_results", ["id"])
+
+def downgrade():
+    op.drop_table("pipeline_stage_results")
@@ -0,0 +1,31 @@
+# backend/alembic/versions/0004_market_run_source.py
+"""source size and hash on market profile runs
+
+Revision ID: 0004
+Revises: 0003
+Create Date: 2026-10-18
+"""
+from alembic import op
+import sqlalchemy as sa
+
+revision = "0004"
+down_revision = "0003"
+branch_labels = None
+depends_on = None
+
+def upgrade():
+    inspector = sa.inspect(op.get_bind())
+    if "market_profile_runs" not in inspector.get_table_names():
+        return
+    
+    columns = {c["name"] for c in inspector.get_columns("market_profile_runs")}
+    with op.batch_alter_table("market_profile_runs") as batch:
+        if "source_size" not in columns:
+            batch.add_column(sa.Column("source_size", sa.BigInteger, nullable=True))
+        if "source_sha256" not in columns:
+            batch.add_column(sa.Column("source_sha256", sa.String, nullable=True))
+
+def downgrade():
+    with op.batch_alter_table("market_profile_runs") as batch:
+        batch.drop_column("source_sha256")
+        batch.drop_column("source_size")
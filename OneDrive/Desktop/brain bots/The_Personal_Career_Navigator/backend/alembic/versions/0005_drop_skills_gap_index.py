@@ -0,0 +1,25 @@
+# backend/alembic/versions/0005_drop_skills_gap_index.py
+"""drop the unused (user_id, gap_score) index on skills
+
+Revision ID: 0005
+Revises: 0004
+Create Date: 2026-10-18
+"""
+from alembic import op
+import sqlalchemy as sa
+
+revision = "0005"
+down_revision = "0004"
+branch_labels = None
+depends_on = None
+
+def upgrade():
+    # /gaps ranks on decayed levels computed at read time, so an index on
+    # the stored gap_score never serves it; user_id lookups use
+    # uq_skills_user_skill.
+    if "skills" not in sa.inspect(op.get_bind()).get_table_names():
+        return
+    op.drop_index("ix_skills_user_gap", table_name="skills", if_exists=True)
+
+def downgrade():
+    op.create_index("ix_skills_user_gap", "skills", ["user_id", "gap_score"], if_not_exists=True)
@@ -1,68 +1,95 @@
 # backend/app/agents/evaluation_adaptation.py
+from datetime import datetime
 from typing import List, Dict
+import numpy as np
+from sqlalchemy import update
 from sqlalchemy.orm import Session
 from app.models.skill import Skill
-from app.models.evaluation import Evaluation
 from app.schemas.evaluation import WeeklyEvaluation
+from app.services.skill_decay import decayed_levels
+
+# Smaller level changes are dropped rather than rewritten to the row.
+MIN_LEVEL_CHANGE = 1e-3
 
 class EvaluationAdaptationAgent:
     def evaluate_and_adapt(
         self, user_id: int, week_number: int, db: Session
     ) -> WeeklyEvaluation:
-        user_skills = db.query(Skill).filter(Skill.user_id == user_id).all()
+        return self.evaluate_users({user_id: week_number}, db)[user_id]
+    
+    def evaluate_users(
+        self, week_numbers: Dict[int, int], db: Session
+    ) -> Dict[int, WeeklyEvaluation]:
+        user_ids = list(week_numbers)
+        now = datetime.utcnow()
+        rows = db.query(
+            Skill.id, Skill.user_id, Skill.skill_name, Skill.user_level, Skill.importance,
+            Skill.level_anchor_at, Skill.updated_at
+        ).filter(Skill.user_id.in_(user_ids)).order_by(Skill.user_id, Skill.id).all()
         
-        performance_score = self._calculate_performance_score(user_skills)
+        user_index = {user_id: i for i, user_id in enumerate(user_ids)}
+        owners = np.array([user_index[row.user_id] for row in rows], dtype=np.int64)
+        old_levels = decayed_levels(
+            np.nan_to_num(np.array([row.user_level for row in rows], dtype=np.float64)),
+            [row.level_anchor_at or row.updated_at for row in rows],
+            now
+        )
+        importance = np.nan_to_num(np.array([row.importance for row in rows], dtype=np.float64))
         
-        skills_updated = []
-        for skill in user_skills:
-            old_level = skill.user_level
-            
-            new_level = old_level + (performance_score * skill.importance * 0.1)
-            new_level = min(new_level, 1.0)
-            
-            new_level = new_level * 0.98
-            
-            skill.user_level = new_level
-            
-            new_gap_score = skill.importance * (1 - new_level)
-            skill.gap_score = new_gap_score
-            
-            skills_updated.append({
-                "skill": skill.skill_name,
-                "old_level": round(old_level, 3),
-                "new_level": round(new_level, 3),
-                "gap_score": round(new_gap_score, 3)
-            })
+        performance_scores = self._calculate_performance_scores(
+            owners, old_levels, importance, len(user_ids)
+        )
         
-        db.commit()
+        new_levels = np.minimum(old_levels + performance_scores[owners] * importance * 0.1, 1.0)
+        moved = np.abs(new_levels - old_levels) > MIN_LEVEL_CHANGE
+        new_levels = np.where(moved, new_levels, old_levels)
+        gap_scores = importance * (1 - new_levels)
         
-        adaptations = self._determine_adaptations(performance_score)
+        changed = np.flatnonzero(moved)
+        if len(changed):
+            db.execute(update(Skill), [
+                {
+                    "id": rows[i].id,
+                    "user_level": float(new_levels[i]),
+                    "gap_score": float(gap_scores[i]),
+                    "level_anchor_at": now
+                }
+                for i in changed
+            ])
+        db.flush()
         
-        evaluation = WeeklyEvaluation(
-            week_number=week_number,
-            performance_score=round(performance_score, 3),
-            skills_updated=skills_updated,
-            adaptations_made=adaptations
-        )
-        
-        return evaluation
-    
-    def _calculate_performance_score(self, skills: List[Skill]) -> float:
-        if not skills:
-            return 0.5
+        skills_updated = {user_id: [] for user_id in user_ids}
+        for row, old_level, new_level, gap_score in zip(rows, old_levels, new_levels, gap_scores):
+            skills_updated[row.user_id].append({
+                "skill": row.skill_name,
+                "old_level": round(float(old_level), 3),
+                "new_level": round(float(new_level), 3),
+                "gap_score": round(float(gap_score), 3)
+            })
         
-        total_improvement = sum([
-            skill.user_level * skill.importance for skill in skills
-        ])
+        evaluations = {}
+        for user_id in user_ids:
+            performance_score = float(performance_scores[user_index[user_id]])
+            evaluations[user_id] = WeeklyEvaluation(
+                week_number=week_numbers[user_id],
+                performance_score=round(performance_score, 3),
+                skills_updated=skills_updated[user_id],
+                adaptations_made=self._determine_adaptations(performance_score)
+            )
         
-        max_possible = sum([skill.importance for skill in skills])
+        return evaluations
+    
+    def _calculate_performance_scores(
+        self, owners: np.ndarray, levels: np.ndarray, importance: np.ndarray, user_count: int
+    ) -> np.ndarray:
+        total_improvement = np.bincount(owners, weights=levels * importance, minlength=user_count)
+        max_possible = np.bincount(owners, weights=importance, minlength=user_count)
         
-        if max_possible > 0:
-            score = total_improvement / max_possible
-        else:
-            score = 0.5
+        scores = np.full(user_count, 0.5)
+        has_weight = max_possible > 0
+        scores[has_weight] = total_improvement[has_weight] / max_possible[has_weight]
         
-        return min(score, 1.0)
+        return np.minimum(scores, 1.0)
     
     def _determine_adaptations(self, performance_score: float) -> List[str]:
         adaptations = []
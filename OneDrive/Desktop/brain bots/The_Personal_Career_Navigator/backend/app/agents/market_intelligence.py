@@ -1,15 +1,31 @@
 # backend/app/agents/market_intelligence.py
 from typing import List, Dict
+from sqlalchemy.orm import Session
 from app.services.kaggle_loader import KaggleLoader
 from app.services.embedding_service import EmbeddingService
+from app.services.market_cache import MarketAnalysisCache
+from app.services.market_profiles import load_market_profile, parse_skills
 from collections import Counter
 
 class MarketIntelligenceAgent:
     def __init__(self):
         self.kaggle_loader = KaggleLoader()
         self.embedding_service = EmbeddingService()
+        self.cache = MarketAnalysisCache()
     
-    def analyze_role_requirements(self, role: str) -> Dict[str, any]:
+    def analyze_role_requirements(self, role: str, db: Session = None) -> Dict[str, any]:
+        return self.cache.get_or_compute(
+            role,
+            self.kaggle_loader.dataset_version(),
+            lambda: self._analyze_role(role, db)
+        )
+    
+    def _analyze_role(self, role: str, db: Session = None) -> Dict[str, any]:
+        if db is not None:
+            profile = load_market_profile(role, db)
+            if profile:
+                return profile
+        
         job_postings = self.kaggle_loader.load_job_postings(role)
         
         if not job_postings:
@@ -28,15 +44,35 @@ class MarketIntelligenceAgent:
             
             job_descriptions.append(description)
             
-            skills = [s.strip() for s in skills_str.split(",") if s.strip()]
-            all_skills.extend(skills)
+            all_skills.extend(parse_skills(skills_str))
         
-        skill_counts = Counter(all_skills)
+        relevant_postings = self.kaggle_loader.search_postings(role, k=10)
+        if relevant_postings:
+            job_descriptions = [job["description"] for job in relevant_postings]
+        
+        market_skills = self.build_market_skills(
+            Counter(all_skills), len(job_postings), job_descriptions[:10]
+        )
+        
+        return {
+            "role": role,
+            "market_skills": market_skills,
+            "total_jobs_analyzed": len(job_postings)
+        }
+    
+    def build_market_skills(
+        self, skill_counts: Counter, total_jobs: int, descriptions: List[str]
+    ) -> List[Dict]:
+        top_skills = skill_counts.most_common(50)
+        
+        semantic_scores = self.embedding_service.compute_skill_importances(
+            [skill for skill, _ in top_skills], descriptions
+        )
         
         market_skills = []
-        for skill, frequency in skill_counts.most_common(50):
+        for (skill, frequency), semantic_score in zip(top_skills, semantic_scores):
             importance = self._calculate_importance(
-                skill, frequency, len(job_postings), job_descriptions
+                frequency, total_jobs, semantic_score
             )
             
             market_skills.append({
@@ -47,22 +83,14 @@ class MarketIntelligenceAgent:
         
         market_skills.sort(key=lambda x: x["avg_importance"], reverse=True)
         
-        return {
-            "role": role,
-            "market_skills": market_skills,
-            "total_jobs_analyzed": len(job_postings)
-        }
+        return market_skills
     
     def _calculate_importance(
-        self, skill: str, frequency: int, total_jobs: int, descriptions: List[str]
+        self, frequency: int, total_jobs: int, semantic_score: float
     ) -> float:
         frequency_score = frequency / total_jobs
         
-        semantic_score = self.embedding_service.compute_skill_importance(
-            skill, descriptions[:10]
-        )
-        
         importance = (frequency_score * 0.6 + semantic_score * 0.4)
         importance = min(importance, 1.0)
         
-        return round(importance, 3)
\ No newline at end of file
+        return round(importance, 3)
@@ -1,76 +1,197 @@
 # backend/app/agents/orchestrator.py
-from typing import Dict
+import asyncio
+import multiprocessing
+import threading
+import time
+from concurrent.futures import Future, ProcessPoolExecutor, ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Callable, Dict, List, Optional
 from sqlalchemy.orm import Session
+from app.core.config import settings
 from app.agents.profile_extraction import ProfileExtractionAgent
 from app.agents.market_intelligence import MarketIntelligenceAgent
 from app.agents.skill_gap import SkillGapAgent
 from app.agents.roadmap_generator import RoadmapGeneratorAgent
 from app.agents.evaluation_adaptation import EvaluationAdaptationAgent
 from app.models.user import User
-from app.models.skill import Skill
 from app.models.roadmap import Roadmap
-from app.models.evaluation import Evaluation
+# Registers the Evaluation mapper that User.evaluations refers to.
+from app.models import evaluation  # noqa: F401
+from app.schemas.skill import SkillGap
+from app.services.market_profiles import load_market_profile
+from app.services.pipeline_graph import PipelineStage, StageGraph, fingerprint
+from app.services.skill_store import upsert_skill_gaps
+from app.services.upload_store import UploadStore, extraction_version
+
+STAGE_TIMEOUTS = {
+    "resume": 30.0,
+    "github": 20.0,
+    "github_fingerprint": 10.0,
+    "linkedin": 15.0,
+    "market": 60.0
+}
+
+def extract_resume_skills(pdf_path: str) -> List[Dict]:
+    return ProfileExtractionAgent().extract_from_resume(pdf_path)
+
+def extract_linkedin_skills(json_path: str) -> List[Dict]:
+    return ProfileExtractionAgent().extract_from_linkedin(json_path)
+
+UPLOAD_PARSERS = {
+    "resume": extract_resume_skills,
+    "linkedin": extract_linkedin_skills
+}
+
+def extract_upload_skills(kind: str, path: str) -> List[Dict]:
+    return UploadStore().extract(kind, path, UPLOAD_PARSERS[kind])
 
 class OrchestratorAgent:
-    def __init__(self):
+    def __init__(
+        self,
+        market_agent: MarketIntelligenceAgent = None,
+        stage_timeouts: Dict[str, float] = None
+    ):
         self.profile_agent = ProfileExtractionAgent()
-        self.market_agent = MarketIntelligenceAgent()
+        self.market_agent = market_agent or MarketIntelligenceAgent()
         self.gap_agent = SkillGapAgent()
         self.roadmap_agent = RoadmapGeneratorAgent()
         self.evaluation_agent = EvaluationAdaptationAgent()
+        self.uploads = UploadStore()
+        self.stage_timeouts = {**STAGE_TIMEOUTS, **(stage_timeouts or {})}
+        
+        self._threads = ThreadPoolExecutor(
+            max_workers=settings.PIPELINE_THREAD_WORKERS, thread_name_prefix="pipeline"
+        )
+        self._processes = None
+        self._processes_lock = threading.Lock()
     
     def run_full_pipeline(
-        self, user_id: int, dream_role: str, db: Session
+        self,
+        user_id: int,
+        dream_role: str,
+        db: Session,
+        progress: Callable[[str, Dict], None] = None
     ) -> Dict:
+        report = progress or (lambda stage, detail: None)
+        
         user = db.query(User).filter(User.id == user_id).first()
         if not user:
             return {"error": "User not found"}
         
-        all_extractions = []
+        started_at = time.monotonic()
+        graph = StageGraph([
+            PipelineStage(
+                "profile", [],
+                lambda outputs, _: self._extract_profile(user, started_at),
+                key=lambda: self._profile_key(user),
+                keep=lambda output: not output["degraded_sources"]
+            ),
+            PipelineStage(
+                "market", [],
+                lambda outputs, future: self._market_result(future, dream_role, started_at, db),
+                key=lambda: self.market_agent.cache.key_for(
+                    dream_role, self.market_agent.kaggle_loader.dataset_version()
+                ),
+                start=lambda: self._threads.submit(
+                    self._analyze_market, dream_role, db.get_bind()
+                ),
+                keep=lambda output: not output.get("degraded")
+            ),
+            PipelineStage(
+                "gaps", ["profile", "market"],
+                lambda outputs, _: self._compute_gaps(user_id, outputs, db)
+            ),
+            PipelineStage(
+                "roadmap", ["gaps"],
+                lambda outputs, _: self._create_roadmap(user_id, outputs, db)
+            )
+        ])
         
-        if user.resume_path:
-            resume_skills = self.profile_agent.extract_from_resume(user.resume_path)
-            all_extractions.append(resume_skills)
+        outputs, reused = graph.run(
+            db, user_id,
+            lambda stage, output, cached: report(
+                stage, {**self._stage_detail(stage, output), "reused": cached}
+            )
+        )
+        db.commit()
+        
+        return {
+            "user_id": user_id,
+            "profile_extracted": len(outputs["profile"]["user_skills"]),
+            "market_skills_found": len(outputs["market"]["market_skills"]),
+            "gaps_identified": len(outputs["gaps"]["gaps"]),
+            "roadmap_generated": True,
+            "roadmap_id": outputs["roadmap"]["roadmap_id"],
+            "degraded_sources": outputs["profile"]["degraded_sources"] + (
+                ["market"] if outputs["market"].get("degraded") else []
+            ),
+            "reused_stages": reused
+        }
+    
+    def _profile_key(self, user: User) -> Optional[str]:
+        parts = {"extraction_version": extraction_version()}
+        try:
+            if user.resume_path:
+                parts["resume"] = self.uploads.digest_of(user.resume_path)
+            if user.linkedin_data_path:
+                parts["linkedin"] = self.uploads.digest_of(user.linkedin_data_path)
+        except OSError as e:
+            print(f"Error reading upload: {e}")
+            return None
         
         if user.github_username:
-            github_skills = self.profile_agent.extract_from_github(user.github_username)
-            all_extractions.append(github_skills)
+            try:
+                etag = self.profile_agent.github_service.fingerprint(
+                    user.github_username, timeout=self.stage_timeouts["github_fingerprint"]
+                )
+            except asyncio.TimeoutError:
+                print(f"GitHub fingerprint for {user.github_username} timed out")
+                etag = None
+            if etag is None:
+                return None
+            parts["github"] = [user.github_username, etag]
         
-        if user.linkedin_data_path:
-            linkedin_skills = self.profile_agent.extract_from_linkedin(user.linkedin_data_path)
-            all_extractions.append(linkedin_skills)
+        return fingerprint(parts)
+    
+    def _extract_profile(self, user: User, started_at: float) -> Dict:
+        stages = {}
         
-        user_skills = self.profile_agent.aggregate_skills(all_extractions)
+        if user.resume_path:
+            stages["resume"] = self._submit_extraction("resume", user.resume_path)
         
-        market_analysis = self.market_agent.analyze_role_requirements(dream_role)
+        if user.github_username:
+            stages["github"] = self._threads.submit(
+                self.profile_agent.extract_from_github, user.github_username
+            )
         
-        gaps = self.gap_agent.compute_gaps(
-            user_skills, market_analysis["market_skills"]
-        )
+        if user.linkedin_data_path:
+            stages["linkedin"] = self._submit_extraction("linkedin", user.linkedin_data_path)
         
-        for gap in gaps:
-            existing = db.query(Skill).filter(
-                Skill.user_id == user_id,
-                Skill.skill_name == gap.skill
-            ).first()
-            
-            if existing:
-                existing.user_level = gap.user_level
-                existing.importance = gap.importance
-                existing.gap_score = gap.gap_score
+        all_extractions = []
+        degraded_sources = []
+        for name, future in stages.items():
+            extraction = self._stage_result(name, future, started_at)
+            if extraction is None:
+                degraded_sources.append(name)
             else:
-                skill_record = Skill(
-                    user_id=user_id,
-                    skill_name=gap.skill,
-                    user_level=gap.user_level,
-                    importance=gap.importance,
-                    gap_score=gap.gap_score,
-                    evidence=user_skills.get(gap.skill, {}).get("evidence", [])
-                )
-                db.add(skill_record)
+                all_extractions.append(extraction)
         
-        db.commit()
+        return {
+            "user_skills": self.profile_agent.aggregate_skills(all_extractions),
+            "degraded_sources": degraded_sources
+        }
+    
+    def _compute_gaps(self, user_id: int, outputs: Dict, db: Session) -> Dict:
+        user_skills = outputs["profile"]["user_skills"]
+        gaps = self.gap_agent.compute_gaps(
+            user_skills, outputs["market"]["market_skills"]
+        )
         
+        upsert_skill_gaps(db, user_id, gaps, user_skills)
+        return {"gaps": [gap.dict() for gap in gaps]}
+    
+    def _create_roadmap(self, user_id: int, outputs: Dict, db: Session) -> Dict:
+        gaps = [SkillGap(**gap) for gap in outputs["gaps"]["gaps"]]
         roadmap_days = self.roadmap_agent.generate_roadmap(gaps, days=30)
         
         roadmap_record = Roadmap(
@@ -80,13 +201,101 @@ class OrchestratorAgent:
             status="active"
         )
         db.add(roadmap_record)
-        db.commit()
+        db.flush()
+        return {"roadmap_id": roadmap_record.id}
+    
+    def _stage_detail(self, stage: str, output: Dict) -> Dict:
+        if stage == "profile":
+            return {
+                "skills_extracted": len(output["user_skills"]),
+                "degraded_sources": output["degraded_sources"]
+            }
+        if stage == "market":
+            return {
+                "market_skills_found": len(output["market_skills"]),
+                "degraded": bool(output.get("degraded"))
+            }
+        if stage == "gaps":
+            return {"gaps_identified": len(output["gaps"])}
+        return {"roadmap_id": output["roadmap_id"]}
+    
+    def _analyze_market(self, dream_role: str, bind) -> Dict:
+        with Session(bind=bind) as market_db:
+            return self.market_agent.analyze_role_requirements(dream_role, market_db)
+    
+    def _market_result(
+        self, future: Future, dream_role: str, started_at: float, db: Session
+    ) -> Dict:
+        try:
+            return future.result(timeout=self._remaining(started_at, "market"))
+        except Exception as e:
+            future.cancel()
+            print(f"Pipeline stage market failed: {e!r}")
         
-        return {
-            "user_id": user_id,
-            "profile_extracted": len(user_skills),
-            "market_skills_found": len(market_analysis["market_skills"]),
-            "gaps_identified": len(gaps),
-            "roadmap_generated": True,
-            "roadmap_id": roadmap_record.id
-        }
\ No newline at end of file
+        # Fall back to the precomputed profile, or to no market skills at all.
+        fallback = None
+        try:
+            fallback = load_market_profile(dream_role, db)
+        except Exception as e:
+            print(f"Error loading market profile fallback: {e}")
+        if fallback is None:
+            fallback = {"role": dream_role, "market_skills": [], "total_jobs_analyzed": 0}
+        return {**fallback, "degraded": True}
+    
+    def _submit_extraction(self, kind: str, path: str) -> Future:
+        try:
+            skills = self.uploads.cached_skills(kind, self.uploads.digest_of(path))
+        except OSError as e:
+            print(f"Error reading upload {path}: {e}")
+            skills = None
+        
+        if skills is not None:
+            future = Future()
+            future.set_result(skills)
+            return future
+        
+        if kind == "resume":
+            # PDF extraction already runs in its own limited process.
+            return self._threads.submit(extract_upload_skills, kind, path)
+        
+        return self._submit_parse(extract_upload_skills, kind, path)
+    
+    def _submit_parse(self, fn, *args) -> Future:
+        if multiprocessing.current_process().daemon:
+            # Celery prefork workers are daemonic and cannot start children.
+            return self._threads.submit(fn, *args)
+        
+        try:
+            return self._process_pool().submit(fn, *args)
+        except (BrokenProcessPool, RuntimeError, OSError, AssertionError) as e:
+            print(f"Process pool unavailable, parsing in thread: {e}")
+            self._reset_process_pool()
+            return self._threads.submit(fn, *args)
+    
+    def _stage_result(self, name: str, future: Future, started_at: float) -> Optional[List[Dict]]:
+        try:
+            return future.result(timeout=self._remaining(started_at, name))
+        except Exception as e:
+            future.cancel()
+            if isinstance(e, BrokenProcessPool):
+                self._reset_process_pool()
+            print(f"Pipeline stage {name} failed: {e!r}")
+            return None
+    
+    def _remaining(self, started_at: float, stage: str) -> float:
+        return max(started_at + self.stage_timeouts[stage] - time.monotonic(), 0.0)
+    
+    def _process_pool(self) -> ProcessPoolExecutor:
+        with self._processes_lock:
+            if self._processes is None:
+                self._processes = ProcessPoolExecutor(
+                    max_workers=settings.PIPELINE_PROCESS_WORKERS,
+                    mp_context=multiprocessing.get_context("spawn")
+                )
+            return self._processes
+    
+    def _reset_process_pool(self) -> None:
+        with self._processes_lock:
+            if self._processes is not None:
+                self._processes.shutdown(wait=False, cancel_futures=True)
+                self._processes = None
\ No newline at end of file
@@ -1,37 +1,30 @@
 # backend/app/agents/profile_extraction.py
 from typing import List, Dict
-import PyPDF2
 from app.services.github_service import GitHubService
 from app.services.linkedin_service import LinkedInService
-import spacy
+from app.services.pdf_extractor import extract_pdf_skills
+from app.services.skill_matcher import get_skill_matcher
+
+def resume_skill_entries(extracted_skills: List[str]) -> List[Dict]:
+    return [
+        {
+            "skill": skill,
+            "source": "resume",
+            "evidence": {"found_in_resume": True}
+        }
+        for skill in extracted_skills
+    ]
 
 class ProfileExtractionAgent:
     def __init__(self):
         self.github_service = GitHubService()
         self.linkedin_service = LinkedInService()
-        try:
-            self.nlp = spacy.load("en_core_web_sm")
-        except:
-            self.nlp = None
     
     def extract_from_resume(self, pdf_path: str) -> List[Dict]:
         skills = []
         
         try:
-            with open(pdf_path, 'rb') as file:
-                pdf_reader = PyPDF2.PdfReader(file)
-                text = ""
-                for page in pdf_reader.pages:
-                    text += page.extract_text()
-            
-            extracted_skills = self._extract_skills_from_text(text)
-            
-            for skill in extracted_skills:
-                skills.append({
-                    "skill": skill,
-                    "source": "resume",
-                    "evidence": {"found_in_resume": True}
-                })
+            skills = resume_skill_entries(extract_pdf_skills(pdf_path))
         
         except Exception as e:
             print(f"Error extracting resume: {e}")
@@ -45,26 +38,7 @@ class ProfileExtractionAgent:
         return self.linkedin_service.extract_skills(json_path)
     
     def _extract_skills_from_text(self, text: str) -> List[str]:
-        skills_keywords = [
-            "Python", "JavaScript", "Java", "C++", "C#", "Ruby", "Go", "Rust",
-            "React", "Angular", "Vue.js", "Node.js", "Django", "Flask", "FastAPI",
-            "Docker", "Kubernetes", "Jenkins", "CI/CD", "Git",
-            "AWS", "Azure", "GCP", "Cloud",
-            "SQL", "PostgreSQL", "MySQL", "MongoDB", "Redis",
-            "Machine Learning", "Deep Learning", "NLP", "Computer Vision",
-            "TensorFlow", "PyTorch", "Scikit-learn",
-            "Data Science", "Analytics", "Statistics",
-            "Agile", "Scrum", "Leadership", "Project Management"
-        ]
-        
-        found_skills = []
-        text_lower = text.lower()
-        
-        for skill in skills_keywords:
-            if skill.lower() in text_lower:
-                found_skills.append(skill)
-        
-        return list(set(found_skills))
+        return get_skill_matcher().find(text)
     
     def aggregate_skills(self, all_extractions: List[List[Dict]]) -> Dict[str, Dict]:
         skill_map = {}
@@ -1,6 +1,9 @@
 # backend/app/agents/skill_gap.py
+from datetime import datetime
 from typing import List, Dict
+from app.models.skill import Skill
 from app.schemas.skill import SkillGap
+from app.services.skill_decay import anchor_of, decayed_level
 
 class SkillGapAgent:
     def compute_gaps(
@@ -27,4 +30,21 @@ class SkillGapAgent:
         
         gaps.sort(key=lambda x: x.gap_score, reverse=True)
         
+        return gaps
+    
+    def current_gaps(self, skills: List[Skill], now: datetime = None) -> List[SkillGap]:
+        now = now or datetime.utcnow()
+        gaps = []
+        
+        for skill in skills:
+            user_level = decayed_level(skill.user_level, anchor_of(skill), now)
+            gaps.append(SkillGap(
+                skill=skill.skill_name,
+                importance=skill.importance,
+                user_level=user_level,
+                gap_score=round(skill.importance * (1 - user_level), 3)
+            ))
+        
+        gaps.sort(key=lambda x: x.gap_score, reverse=True)
+        
         return gaps
\ No newline at end of file
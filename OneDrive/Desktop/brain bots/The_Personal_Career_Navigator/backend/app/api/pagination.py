@@ -0,0 +1,46 @@
+# backend/app/api/pagination.py
+import base64
+from datetime import datetime
+from typing import List, Optional, Tuple
+from fastapi import HTTPException, Response
+from sqlalchemy import Select, and_, or_
+from sqlalchemy.ext.asyncio import AsyncSession
+
+NEXT_CURSOR_HEADER = "X-Next-Cursor"
+
+def encode_cursor(created_at: datetime, row_id: int) -> str:
+    raw = f"{created_at.isoformat()}|{row_id}"
+    return base64.urlsafe_b64encode(raw.encode()).decode()
+
+def decode_cursor(cursor: str) -> Tuple[datetime, int]:
+    try:
+        created_at, row_id = base64.urlsafe_b64decode(cursor.encode()).decode().split("|")
+        return datetime.fromisoformat(created_at), int(row_id)
+    except (ValueError, UnicodeDecodeError):
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+
+async def keyset_page(
+    db: AsyncSession, stmt: Select, model, cursor: Optional[str], limit: int, response: Response
+) -> List:
+    """Newest-first page of `stmt`, continuing after `cursor`.
+
+    Rows are ordered by (created_at, id) descending so the per-user
+    composite indexes serve each page without an offset scan. The cursor
+    for the next page is returned in the X-Next-Cursor header.
+    """
+    if cursor:
+        created_at, row_id = decode_cursor(cursor)
+        stmt = stmt.where(or_(
+            model.created_at < created_at,
+            and_(model.created_at == created_at, model.id < row_id)
+        ))
+    
+    rows = (await db.scalars(
+        stmt.order_by(model.created_at.desc(), model.id.desc()).limit(limit + 1)
+    )).all()
+    
+    if len(rows) > limit:
+        rows = rows[:limit]
+        response.headers[NEXT_CURSOR_HEADER] = encode_cursor(rows[-1].created_at, rows[-1].id)
+    
+    return rows
@@ -1,7 +1,11 @@
 # backend/app/api/routes_evaluation.py
-from fastapi import APIRouter, Depends
+from typing import Optional
+from fastapi import APIRouter, Depends, HTTPException, Query, Response
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
-from app.db.session import get_db
+from app.db.session import get_db, get_async_db
+from app.api.pagination import keyset_page
 from app.models.evaluation import Evaluation
 from app.agents.evaluation_adaptation import EvaluationAdaptationAgent
 
@@ -51,14 +55,22 @@ def run_evaluation(
         return get_sample_evaluation(user_id, week_number)
 
 @router.get("/{user_id}")
-def get_evaluations(user_id: int, db: Session = Depends(get_db)):
+async def get_evaluations(
+    user_id: int,
+    response: Response,
+    cursor: Optional[str] = None,
+    limit: int = Query(20, ge=1, le=100),
+    db: AsyncSession = Depends(get_async_db)
+):
+    stmt = select(Evaluation).where(Evaluation.user_id == user_id)
+    
     try:
-        evaluations = db.query(Evaluation).filter(
-            Evaluation.user_id == user_id
-        ).order_by(Evaluation.created_at.desc()).all()
+        evaluations = await keyset_page(db, stmt, Evaluation, cursor, limit, response)
         
-        if evaluations:
+        if evaluations or cursor:
             return evaluations
+    except HTTPException:
+        raise
     except Exception as e:
         pass
     
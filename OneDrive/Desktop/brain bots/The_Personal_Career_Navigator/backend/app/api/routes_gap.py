@@ -1,9 +1,10 @@
 # backend/app/api/routes_gap.py
 from fastapi import APIRouter, Depends
-from sqlalchemy.orm import Session
-from app.db.session import get_db
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.db.session import get_async_db
 from app.models.skill import Skill
-from typing import List
+from app.agents.skill_gap import SkillGapAgent
 
 router = APIRouter(prefix="/gaps", tags=["gaps"])
 
@@ -24,23 +25,23 @@ def get_sample_gaps(user_id: int):
     }
 
 @router.get("/{user_id}")
-def get_skill_gaps(user_id: int, db: Session = Depends(get_db)):
+async def get_skill_gaps(user_id: int, db: AsyncSession = Depends(get_async_db)):
+    # Gap scores depend on levels decayed to now, so they are computed and
+    # sorted in memory; the stored gap_score is only a snapshot.
     try:
-        skills = db.query(Skill).filter(Skill.user_id == user_id).order_by(
-            Skill.gap_score.desc()
-        ).all()
+        skills = (await db.scalars(select(Skill).where(Skill.user_id == user_id))).all()
         
         if skills:
             return {
                 "user_id": user_id,
                 "gaps": [
                     {
-                        "skill": s.skill_name,
-                        "importance": s.importance,
-                        "user_level": s.user_level,
-                        "gap_score": s.gap_score
+                        "skill": gap.skill,
+                        "importance": gap.importance,
+                        "user_level": gap.user_level,
+                        "gap_score": gap.gap_score
                     }
-                    for s in skills
+                    for gap in SkillGapAgent().current_gaps(skills)
                 ]
             }
     except Exception as e:
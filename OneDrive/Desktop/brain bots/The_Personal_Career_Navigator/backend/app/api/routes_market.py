@@ -2,15 +2,16 @@
 from fastapi import APIRouter, Depends
 from sqlalchemy.orm import Session
 from app.db.session import get_db
-from app.agents.market_intelligence import MarketIntelligenceAgent
+from app.core.registry import registry
+from app.core.concurrency import run_blocking
 
 router = APIRouter(prefix="/market", tags=["market"])
 
 @router.get("/analyze/{role}")
-def analyze_market(role: str, db: Session = Depends(get_db)):
+async def analyze_market(role: str, db: Session = Depends(get_db)):
     try:
-        agent = MarketIntelligenceAgent()
-        analysis = agent.analyze_role_requirements(role)
+        agent = await run_blocking(registry.get_market_agent)
+        analysis = await run_blocking(agent.analyze_role_requirements, role, db)
         return analysis
     except Exception as e:
         # Return mock data if analysis fails
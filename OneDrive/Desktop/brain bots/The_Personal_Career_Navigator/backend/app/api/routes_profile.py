@@ -1,12 +1,17 @@
 # backend/app/api/routes_profile.py
-from fastapi import APIRouter, Depends, UploadFile, File, Form
+from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, UploadFile, File, Form
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
-from app.db.session import get_db
+from starlette.concurrency import run_in_threadpool
+from app.core.config import settings
+from app.db.session import get_db, get_async_db
 from app.models.user import User
 from app.schemas.user import UserCreate, UserProfile
-from typing import Optional
-import shutil
-import os
+from app.services.github_service import GitHubService
+from app.services.linkedin_service import count_export_profiles
+from app.services.upload_store import UploadStore, UploadTooLarge
+from app.tasks.extraction_tasks import extract_upload
+from typing import Callable, Optional
 
 router = APIRouter(prefix="/profile", tags=["profile"])
 
@@ -18,28 +23,67 @@ def create_user(user: UserCreate, db: Session = Depends(get_db)):
     db.refresh(db_user)
     return db_user
 
+async def store_upload(
+    kind: str,
+    file: UploadFile,
+    max_bytes: int,
+    background_tasks: BackgroundTasks,
+    check: Optional[Callable[[str], None]] = None
+):
+    store = UploadStore()
+    try:
+        stored = await store.save(file, kind, max_bytes)
+    except UploadTooLarge as e:
+        raise HTTPException(status_code=413, detail=str(e))
+    
+    if check:
+        try:
+            await run_in_threadpool(check, stored.path)
+        except HTTPException:
+            await run_in_threadpool(store.discard, stored)
+            raise
+    
+    if store.cached_skills(kind, stored.digest) is None:
+        await schedule_extraction(kind, stored.path, background_tasks)
+    
+    return stored
+
+def check_linkedin_export(path: str) -> None:
+    # Skills are stored per user, so an export must hold a single profile.
+    try:
+        profiles = count_export_profiles(path)
+    except Exception as e:
+        raise HTTPException(status_code=422, detail=f"Unreadable LinkedIn export: {e}")
+    if profiles > 1:
+        raise HTTPException(
+            status_code=422,
+            detail=f"LinkedIn export holds {profiles} profiles; upload one profile per user"
+        )
+
+async def schedule_extraction(kind: str, path: str, background_tasks: BackgroundTasks):
+    try:
+        await run_in_threadpool(extract_upload.apply_async, (kind, path), retry=False)
+    except Exception as e:
+        print(f"Celery unavailable, extracting upload in background: {e}")
+        background_tasks.add_task(extract_upload, kind, path)
+
 @router.post("/upload-resume/{user_id}")
-def upload_resume(
+async def upload_resume(
     user_id: int,
+    background_tasks: BackgroundTasks,
     file: UploadFile = File(...),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
-    user = db.query(User).filter(User.id == user_id).first()
+    user = await db.get(User, user_id)
     if not user:
         return {"error": "User not found"}
     
-    upload_dir = "uploads/resumes"
-    os.makedirs(upload_dir, exist_ok=True)
-    
-    file_path = f"{upload_dir}/{user_id}_{file.filename}"
+    stored = await store_upload("resume", file, settings.MAX_RESUME_BYTES, background_tasks)
     
-    with open(file_path, "wb") as buffer:
-        shutil.copyfileobj(file.file, buffer)
+    user.resume_path = stored.path
+    await db.commit()
     
-    user.resume_path = file_path
-    db.commit()
-    
-    return {"message": "Resume uploaded", "path": file_path}
+    return {"message": "Resume uploaded", "path": stored.path, "sha256": stored.digest}
 
 @router.post("/link-github/{user_id}")
 def link_github(
@@ -51,37 +95,39 @@ def link_github(
     if not user:
         return {"error": "User not found"}
     
+    github_service = GitHubService()
+    if user.github_username:
+        github_service.invalidate(user.github_username)
+    github_service.invalidate(github_username)
+    
     user.github_username = github_username
     db.commit()
     
     return {"message": "GitHub linked", "username": github_username}
 
 @router.post("/upload-linkedin/{user_id}")
-def upload_linkedin(
+async def upload_linkedin(
     user_id: int,
+    background_tasks: BackgroundTasks,
     file: UploadFile = File(...),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
-    user = db.query(User).filter(User.id == user_id).first()
+    user = await db.get(User, user_id)
     if not user:
         return {"error": "User not found"}
     
-    upload_dir = "uploads/linkedin"
-    os.makedirs(upload_dir, exist_ok=True)
+    stored = await store_upload(
+        "linkedin", file, settings.MAX_LINKEDIN_BYTES, background_tasks, check=check_linkedin_export
+    )
     
-    file_path = f"{upload_dir}/{user_id}_{file.filename}"
+    user.linkedin_data_path = stored.path
+    await db.commit()
     
-    with open(file_path, "wb") as buffer:
-        shutil.copyfileobj(file.file, buffer)
-    
-    user.linkedin_data_path = file_path
-    db.commit()
-    
-    return {"message": "LinkedIn data uploaded", "path": file_path}
+    return {"message": "LinkedIn data uploaded", "path": stored.path, "sha256": stored.digest}
 
 @router.get("/{user_id}", response_model=UserProfile)
-def get_user_profile(user_id: int, db: Session = Depends(get_db)):
-    user = db.query(User).filter(User.id == user_id).first()
+async def get_user_profile(user_id: int, db: AsyncSession = Depends(get_async_db)):
+    user = await db.get(User, user_id)
     if not user:
         return {"error": "User not found"}
     return user
\ No newline at end of file
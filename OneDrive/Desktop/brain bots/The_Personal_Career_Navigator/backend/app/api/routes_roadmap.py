@@ -1,9 +1,27 @@
 # backend/app/api/routes_roadmap.py
-from fastapi import APIRouter, Depends
+import asyncio
+import json
+import time
+from typing import Optional
+from fastapi import APIRouter, Depends, Query, Response
+from fastapi.responses import StreamingResponse
+from starlette.concurrency import run_in_threadpool
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
-from app.db.session import get_db
+from app.db.session import get_db, get_async_db
+from app.api.pagination import keyset_page
 from app.models.roadmap import Roadmap
-from app.agents.orchestrator import OrchestratorAgent
+from app.core.registry import registry
+from app.core.concurrency import run_blocking
+from app.tasks.celery_app import celery_app
+from app.tasks.roadmap_tasks import generate_roadmap_job
+
+EVENT_POLL_SECONDS = 0.5
+EVENT_KEEPALIVE_SECONDS = 15.0
+# Celery reports unknown or expired job ids as PENDING forever.
+EVENT_PENDING_GRACE_SECONDS = 120.0
+EVENT_MAX_SECONDS = 30 * 60.0
 
 router = APIRouter(prefix="/roadmap", tags=["roadmap"])
 
@@ -66,26 +84,92 @@ def get_sample_roadmap(user_id: int, dream_role: str):
     }
 
 @router.post("/generate/{user_id}")
-def generate_roadmap(
+async def generate_roadmap(
     user_id: int,
     dream_role: str,
+    background: bool = False,
     db: Session = Depends(get_db)
 ):
+    if background:
+        job = await run_in_threadpool(generate_roadmap_job.delay, user_id, dream_role)
+        return {
+            "job_id": job.id,
+            "status": "PENDING",
+            "status_url": f"/roadmap/jobs/{job.id}",
+            "events_url": f"/roadmap/jobs/{job.id}/events"
+        }
+    
     try:
-        orchestrator = OrchestratorAgent()
-        result = orchestrator.run_full_pipeline(user_id, dream_role, db)
+        orchestrator = await run_blocking(registry.get_orchestrator)
+        result = await run_blocking(orchestrator.run_full_pipeline, user_id, dream_role, db)
         return result
     except Exception as e:
         # Return sample roadmap if generation fails
         return get_sample_roadmap(user_id, dream_role)
 
+def get_job_status(job_id: str):
+    job = celery_app.AsyncResult(job_id)
+    status = {"job_id": job_id, "status": job.state}
+    
+    if job.state == "PROGRESS":
+        status.update(job.info or {})
+    elif job.state == "SUCCESS":
+        status["stages"] = job.result.get("stages", {})
+        status["result"] = job.result
+    elif job.state == "FAILURE":
+        status["error"] = str(job.result)
+    
+    return status
+
+@router.get("/jobs/{job_id}")
+async def get_roadmap_job(job_id: str):
+    return await run_in_threadpool(get_job_status, job_id)
+
+@router.get("/jobs/{job_id}/events")
+async def stream_roadmap_job(job_id: str):
+    async def events():
+        last_seen = None
+        idle = 0.0
+        opened_at = time.monotonic()
+        
+        while True:
+            status = await run_in_threadpool(get_job_status, job_id)
+            seen = (status["status"], status.get("stage"))
+            elapsed = time.monotonic() - opened_at
+            
+            if status["status"] == "PENDING" and elapsed >= EVENT_PENDING_GRACE_SECONDS:
+                status.update(status="UNKNOWN", error="Job not found, expired or not started yet")
+            elif elapsed >= EVENT_MAX_SECONDS:
+                status.update(status="TIMEOUT", error="Stopped streaming; poll the job status instead")
+            
+            if status["status"] in ("SUCCESS", "FAILURE", "UNKNOWN", "TIMEOUT"):
+                yield f"event: done\ndata: {json.dumps(status, default=str)}\n\n"
+                return
+            
+            if seen != last_seen:
+                last_seen = seen
+                idle = 0.0
+                yield f"event: progress\ndata: {json.dumps(status, default=str)}\n\n"
+            elif idle >= EVENT_KEEPALIVE_SECONDS:
+                idle = 0.0
+                yield ": keepalive\n\n"
+            
+            await asyncio.sleep(EVENT_POLL_SECONDS)
+            idle += EVENT_POLL_SECONDS
+    
+    return StreamingResponse(
+        events(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    )
+
 @router.get("/{user_id}")
-def get_roadmap(user_id: int, db: Session = Depends(get_db)):
+async def get_roadmap(user_id: int, db: AsyncSession = Depends(get_async_db)):
     try:
-        roadmap = db.query(Roadmap).filter(
+        roadmap = (await db.scalars(select(Roadmap).where(
             Roadmap.user_id == user_id,
             Roadmap.status == "active"
-        ).order_by(Roadmap.created_at.desc()).first()
+        ).order_by(Roadmap.created_at.desc()).limit(1))).first()
         
         if roadmap:
             return roadmap
@@ -93,4 +177,16 @@ def get_roadmap(user_id: int, db: Session = Depends(get_db)):
         pass
     
     # Return sample roadmap if not found or error
-    return get_sample_roadmap(user_id, "Data Scientist")
\ No newline at end of file
+    return get_sample_roadmap(user_id, "Data Scientist")
+
+@router.get("/{user_id}/history")
+async def get_roadmap_history(
+    user_id: int,
+    response: Response,
+    status: str = "active",
+    cursor: Optional[str] = None,
+    limit: int = Query(20, ge=1, le=100),
+    db: AsyncSession = Depends(get_async_db)
+):
+    stmt = select(Roadmap).where(Roadmap.user_id == user_id, Roadmap.status == status)
+    return await keyset_page(db, stmt, Roadmap, cursor, limit, response)
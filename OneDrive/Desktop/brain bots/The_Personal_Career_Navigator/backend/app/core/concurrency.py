@@ -0,0 +1,15 @@
+# backend/app/core/concurrency.py
+import asyncio
+import functools
+from concurrent.futures import ThreadPoolExecutor
+from app.core.config import settings
+
+# Agent work (model inference, pipeline runs) gets its own threads so it
+# cannot use up the threadpool Starlette runs cheap sync handlers on.
+_executor = ThreadPoolExecutor(
+    max_workers=settings.BLOCKING_WORKERS, thread_name_prefix="blocking"
+)
+
+async def run_blocking(fn, *args, **kwargs):
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(_executor, functools.partial(fn, *args, **kwargs))
@@ -3,10 +3,42 @@ from pydantic_settings import BaseSettings
 
 class Settings(BaseSettings):
     DATABASE_URL: str
+    ASYNC_DATABASE_URL: str = ""
+    DB_POOL_SIZE: int = 10
+    DB_MAX_OVERFLOW: int = 20
+    DB_POOL_TIMEOUT: float = 30.0
+    DB_POOL_RECYCLE: int = 1800
+    DB_POOL_PRE_PING: bool = True
     REDIS_URL: str
     SECRET_KEY: str
     GITHUB_TOKEN: str = ""
+    GITHUB_API_URL: str = "https://api.github.com"
+    GITHUB_USE_GRAPHQL: bool = False
+    GITHUB_MAX_CONCURRENCY: int = 8
+    GITHUB_TIMEOUT: float = 10.0
+    GITHUB_CACHE_PATH: str = "cache/github_http.sqlite3"
+    GITHUB_CACHE_MAX_BYTES: int = 64 * 1024 * 1024
     KAGGLE_DATASET_PATH: str = ""
+    KAGGLE_SNAPSHOT_PATH: str = ""
+    MARKET_CACHE_TTL: int = 3600
+    VECTOR_INDEX_DIR: str = "cache/vector_index"
+    SKILL_TAXONOMY_PATH: str = ""
+    PIPELINE_THREAD_WORKERS: int = 16
+    PIPELINE_PROCESS_WORKERS: int = 2
+    BLOCKING_WORKERS: int = 16
+    UPLOAD_DIR: str = "uploads"
+    MAX_RESUME_BYTES: int = 10 * 1024 * 1024
+    MAX_LINKEDIN_BYTES: int = 50 * 1024 * 1024
+    PDF_WORKERS: int = 2
+    PDF_MAX_PAGES: int = 20
+    PDF_TIMEOUT: float = 15.0
+    PDF_MAX_MEMORY_MB: int = 512
+    ROADMAP_JOB_TIME_LIMIT: int = 900
+    EVALUATION_CHUNK_SIZE: int = 500
+    EVALUATION_RESUME_AFTER: int = 6 * 3600
+    WARM_MODELS_ON_STARTUP: bool = True
+    EMBEDDING_CACHE_DIR: str = "cache/embeddings"
+    EMBEDDING_CACHE_SIZE: int = 50000
     
     class Config:
         env_file = ".env"
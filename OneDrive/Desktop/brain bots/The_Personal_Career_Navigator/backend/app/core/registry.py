@@ -0,0 +1,106 @@
+# backend/app/core/registry.py
+import threading
+from typing import Any, Callable, Dict
+
+SENTENCE_MODEL_NAME = "all-MiniLM-L6-v2"
+# Loaded by the profile backfill only; request paths match skills without spaCy.
+SPACY_MODEL_NAME = "en_core_web_sm"
+
+class ModelRegistry:
+    """Process-wide holder for heavy models and the agents built on them.
+
+    Each entry is built at most once per worker, on first use or during
+    warm-up. Heavy libraries are imported inside the loaders so importing
+    the app stays cheap.
+    """
+
+    def __init__(self):
+        self._lock = threading.RLock()
+        self._instances: Dict[str, Any] = {}
+        self._failures: Dict[str, str] = {}
+        self._loaders: Dict[str, Callable[[], Any]] = {
+            "sentence_model": self._load_sentence_model,
+            "embedding_cache": self._load_embedding_cache,
+            "market_agent": self._load_market_agent,
+            "orchestrator": self._load_orchestrator,
+        }
+
+    def get(self, name: str) -> Any:
+        if name in self._instances:
+            return self._instances[name]
+        
+        with self._lock:
+            if name not in self._instances:
+                self._failures.pop(name, None)
+                try:
+                    self._instances[name] = self._loaders[name]()
+                except Exception as e:
+                    self._failures[name] = repr(e)
+                    raise
+            return self._instances[name]
+
+    def get_sentence_model(self):
+        return self.get("sentence_model")
+
+    def get_embedding_cache(self):
+        return self.get("embedding_cache")
+
+    def get_market_agent(self):
+        return self.get("market_agent")
+
+    def get_orchestrator(self):
+        return self.get("orchestrator")
+
+    def warm_up(self) -> None:
+        for name in ("sentence_model", "embedding_cache", "orchestrator"):
+            try:
+                self.get(name)
+            except Exception as e:
+                print(f"Error warming up {name}: {e}")
+
+        try:
+            self._warm_title_index()
+        except Exception as e:
+            print(f"Error warming up title index: {e}")
+
+    def status(self) -> Dict[str, bool]:
+        return {name: name in self._instances for name in self._loaders}
+
+    def failures(self) -> Dict[str, str]:
+        return dict(self._failures)
+
+    def is_ready(self) -> bool:
+        return "sentence_model" in self._instances and "sentence_model" not in self._failures
+
+    def _load_sentence_model(self):
+        from sentence_transformers import SentenceTransformer
+        return SentenceTransformer(SENTENCE_MODEL_NAME)
+
+    def _load_embedding_cache(self):
+        from app.core.config import settings
+        from app.services.embedding_cache import EmbeddingCache
+        return EmbeddingCache(
+            SENTENCE_MODEL_NAME,
+            self.get_sentence_model().get_sentence_embedding_dimension(),
+            max_entries=settings.EMBEDDING_CACHE_SIZE,
+            directory=settings.EMBEDDING_CACHE_DIR
+        )
+
+    def _warm_title_index(self) -> None:
+        from app.core.config import settings
+        from app.services.job_snapshot import JobPostingsSnapshot
+        from app.services.title_index import get_title_index
+        if settings.KAGGLE_DATASET_PATH:
+            snapshot = JobPostingsSnapshot()
+            snapshot.ensure()
+            get_title_index(snapshot)
+
+    def _load_market_agent(self):
+        from app.agents.market_intelligence import MarketIntelligenceAgent
+        return MarketIntelligenceAgent()
+
+    def _load_orchestrator(self):
+        from app.agents.orchestrator import OrchestratorAgent
+        return OrchestratorAgent(market_agent=self.get_market_agent())
+
+registry = ModelRegistry()
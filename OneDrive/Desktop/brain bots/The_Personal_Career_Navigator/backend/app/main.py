@@ -1,8 +1,14 @@
 # backend/app/main.py
+import threading
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import JSONResponse
+from app.core.config import settings
+from app.core.registry import registry
 from app.db.base import Base
 from app.db.session import engine
+# Tables no route imports, registered so create_all builds them.
+from app.models import market_profile, pipeline_stage  # noqa: F401
 from app.api import routes_profile, routes_market, routes_gap, routes_roadmap, routes_evaluation
 
 Base.metadata.create_all(bind=engine)
@@ -21,6 +27,7 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=["X-Next-Cursor"],
 )
 
 app.include_router(routes_profile.router)
@@ -29,10 +36,40 @@ app.include_router(routes_gap.router)
 app.include_router(routes_roadmap.router)
 app.include_router(routes_evaluation.router)
 
+@app.on_event("startup")
+def warm_models():
+    if settings.WARM_MODELS_ON_STARTUP:
+        threading.Thread(target=registry.warm_up, daemon=True).start()
+
 @app.get("/")
 def root():
     return {"message": "Personal Career Navigator API"}
 
 @app.get("/health")
 def health():
-    return {"status": "healthy"}
\ No newline at end of file
+    return {"status": "healthy"}
+
+@app.get("/ready")
+def ready():
+    failures = registry.failures()
+    status = {
+        "status": "ready" if registry.is_ready() else ("failed" if failures else "warming"),
+        "models": registry.status(),
+        "failures": failures
+    }
+    if not registry.is_ready():
+        return JSONResponse(status_code=503, content=status)
+    return status
+
+
+@app.get("/stats")
+def stats():
+    status = registry.status()
+    return {
+        "embedding_cache": (
+            registry.get_embedding_cache().stats() if status["embedding_cache"] else None
+        ),
+        "market_cache": (
+            registry.get_market_agent().cache.stats() if status["market_agent"] else None
+        )
+    }
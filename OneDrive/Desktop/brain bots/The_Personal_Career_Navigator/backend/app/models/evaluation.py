@@ -1,18 +1,34 @@
 # backend/app/models/evaluation.py
-from sqlalchemy import Column, Float, Integer, ForeignKey, DateTime, JSON
+from sqlalchemy import Column, Float, Integer, String, ForeignKey, DateTime, JSON, Index, UniqueConstraint
 from sqlalchemy.orm import relationship
 from datetime import datetime
 from app.db.base import Base
 
 class Evaluation(Base):
     __tablename__ = "evaluations"
+    __table_args__ = (
+        UniqueConstraint("user_id", "run_id", name="uq_evaluations_user_run"),
+        Index("ix_evaluations_user_created", "user_id", "created_at"),
+    )
     
     id = Column(Integer, primary_key=True, index=True)
     user_id = Column(Integer, ForeignKey("users.id"))
+    run_id = Column(Integer, ForeignKey("evaluation_runs.id"), nullable=True)
     week_number = Column(Integer)
     performance_score = Column(Float)
     skills_updated = Column(JSON)
     adaptations_made = Column(JSON)
     created_at = Column(DateTime, default=datetime.utcnow)
     
-    user = relationship("User", back_populates="evaluations")
\ No newline at end of file
+    user = relationship("User", back_populates="evaluations")
+
+class EvaluationRun(Base):
+    __tablename__ = "evaluation_runs"
+    
+    id = Column(Integer, primary_key=True, index=True)
+    run_key = Column(String, unique=True, index=True)
+    status = Column(String, default="running")
+    users_evaluated = Column(Integer, default=0)
+    dispatched_at = Column(DateTime, nullable=True)
+    started_at = Column(DateTime, default=datetime.utcnow)
+    finished_at = Column(DateTime, nullable=True)
@@ -0,0 +1,30 @@
+# backend/app/models/market_profile.py
+from sqlalchemy import Column, String, Integer, BigInteger, DateTime, JSON, Boolean
+from datetime import datetime
+from app.db.base import Base
+
+class MarketProfile(Base):
+    __tablename__ = "market_profiles"
+    
+    id = Column(Integer, primary_key=True, index=True)
+    role_key = Column(String, unique=True, index=True)
+    role_title = Column(String)
+    total_jobs = Column(Integer, default=0)
+    skill_counts = Column(JSON, default=dict)
+    sample_descriptions = Column(JSON, default=list)
+    market_skills = Column(JSON, default=list)
+    dataset_version = Column(String)
+    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+
+class MarketProfileRun(Base):
+    __tablename__ = "market_profile_runs"
+    
+    id = Column(Integer, primary_key=True, index=True)
+    dataset_version = Column(String)
+    source_size = Column(BigInteger, nullable=True)
+    source_sha256 = Column(String, nullable=True)
+    rows_processed = Column(Integer, default=0)
+    incremental = Column(Boolean, default=False)
+    status = Column(String, default="running")
+    started_at = Column(DateTime, default=datetime.utcnow)
+    finished_at = Column(DateTime, nullable=True)
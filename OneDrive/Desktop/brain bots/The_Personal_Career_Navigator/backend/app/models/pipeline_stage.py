@@ -0,0 +1,17 @@
+# backend/app/models/pipeline_stage.py
+from sqlalchemy import Column, String, Integer, ForeignKey, DateTime, JSON, UniqueConstraint
+from datetime import datetime
+from app.db.base import Base
+
+class PipelineStageResult(Base):
+    __tablename__ = "pipeline_stage_results"
+    __table_args__ = (
+        UniqueConstraint("user_id", "stage", name="uq_pipeline_stage_results_user_stage"),
+    )
+    
+    id = Column(Integer, primary_key=True, index=True)
+    user_id = Column(Integer, ForeignKey("users.id"))
+    stage = Column(String)
+    fingerprint = Column(String)
+    output = Column(JSON)
+    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
@@ -1,11 +1,14 @@
 # backend/app/models/roadmap.py
-from sqlalchemy import Column, String, Integer, ForeignKey, DateTime, JSON, Text
+from sqlalchemy import Column, String, Integer, ForeignKey, DateTime, JSON, Text, Index
 from sqlalchemy.orm import relationship
 from datetime import datetime
 from app.db.base import Base
 
 class Roadmap(Base):
     __tablename__ = "roadmaps"
+    __table_args__ = (
+        Index("ix_roadmaps_user_status_created", "user_id", "status", "created_at"),
+    )
     
     id = Column(Integer, primary_key=True, index=True)
     user_id = Column(Integer, ForeignKey("users.id"))
@@ -1,11 +1,14 @@
 # backend/app/models/skill.py
-from sqlalchemy import Column, String, Float, Integer, ForeignKey, DateTime, JSON
+from sqlalchemy import Column, String, Float, Integer, ForeignKey, DateTime, JSON, UniqueConstraint
 from sqlalchemy.orm import relationship
 from datetime import datetime
 from app.db.base import Base
 
 class Skill(Base):
     __tablename__ = "skills"
+    __table_args__ = (
+        UniqueConstraint("user_id", "skill_name", name="uq_skills_user_skill"),
+    )
     
     id = Column(Integer, primary_key=True, index=True)
     user_id = Column(Integer, ForeignKey("users.id"))
@@ -15,6 +18,7 @@ class Skill(Base):
     gap_score = Column(Float, default=0.0)
     evidence = Column(JSON, default=list)
     last_practiced = Column(DateTime, nullable=True)
+    level_anchor_at = Column(DateTime, nullable=True)
     created_at = Column(DateTime, default=datetime.utcnow)
     updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
     
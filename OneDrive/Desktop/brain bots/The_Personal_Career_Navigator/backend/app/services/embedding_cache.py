@@ -0,0 +1,168 @@
+# backend/app/services/embedding_cache.py
+import hashlib
+import os
+import threading
+from collections import OrderedDict
+from typing import Dict, List, Optional
+import numpy as np
+
+try:
+    import fcntl
+except ImportError:
+    fcntl = None
+
+class EmbeddingCache:
+    """Content-addressed embedding store keyed by sha256(model_name, text).
+
+    Lookups hit a bounded in-process LRU first and then an append-only
+    on-disk tier: a float32 vector file read through np.memmap plus a key
+    file whose line number is the vector row. Writers append under an
+    exclusive file lock, so several workers can share one directory.
+    """
+
+    def __init__(
+        self, model_name: str, dim: int, max_entries: int = 50000, directory: str = ""
+    ):
+        self.model_name = model_name
+        self.dim = dim
+        self.max_entries = max_entries
+        
+        self.memory_hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+        
+        self._lock = threading.Lock()
+        self._memory: "OrderedDict[str, np.ndarray]" = OrderedDict()
+        
+        self._disk_index: Dict[str, int] = {}
+        self._keys_offset = 0
+        self._disk_rows = 0
+        self._vectors: Optional[np.memmap] = None
+        self._dir = ""
+        
+        if directory:
+            self._dir = os.path.join(directory, model_name.replace("/", "_"))
+            os.makedirs(self._dir, exist_ok=True)
+            self._keys_path = os.path.join(self._dir, f"keys_{dim}.txt")
+            self._vectors_path = os.path.join(self._dir, f"vectors_{dim}.f32")
+            self._lock_path = os.path.join(self._dir, f"write_{dim}.lock")
+    
+    def key(self, text: str) -> str:
+        return hashlib.sha256(f"{self.model_name}\0{text}".encode("utf-8")).hexdigest()
+    
+    def get_many(self, texts: List[str]) -> List[Optional[np.ndarray]]:
+        keys = [self.key(text) for text in texts]
+        results: List[Optional[np.ndarray]] = [None] * len(texts)
+        
+        with self._lock:
+            pending = []
+            for i, key in enumerate(keys):
+                vector = self._memory.get(key)
+                if vector is not None:
+                    self._memory.move_to_end(key)
+                    self.memory_hits += 1
+                    results[i] = vector
+                else:
+                    pending.append(i)
+            
+            if pending and self._dir:
+                self._refresh_disk()
+            
+            for i in pending:
+                row = self._disk_index.get(keys[i])
+                if row is None:
+                    self.misses += 1
+                    continue
+                vector = np.array(self._vectors[row])
+                self.disk_hits += 1
+                self._remember(keys[i], vector)
+                results[i] = vector
+        
+        return results
+    
+    def put_many(self, texts: List[str], vectors: np.ndarray) -> None:
+        keys = [self.key(text) for text in texts]
+        vectors = np.asarray(vectors, dtype=np.float32).reshape(len(keys), self.dim)
+        
+        with self._lock:
+            for key, vector in zip(keys, vectors):
+                self._remember(key, vector)
+            
+            if self._dir:
+                self._append_to_disk(keys, vectors)
+    
+    def stats(self) -> Dict[str, int]:
+        lookups = self.memory_hits + self.disk_hits + self.misses
+        return {
+            "model": self.model_name,
+            "memory_hits": self.memory_hits,
+            "disk_hits": self.disk_hits,
+            "misses": self.misses,
+            "hit_rate": round((lookups - self.misses) / lookups, 3) if lookups else 0.0,
+            "memory_entries": len(self._memory),
+            "memory_capacity": self.max_entries,
+            "disk_entries": len(self._disk_index)
+        }
+    
+    def _remember(self, key: str, vector: np.ndarray) -> None:
+        self._memory[key] = vector
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.max_entries:
+            self._memory.popitem(last=False)
+    
+    def _refresh_disk(self) -> None:
+        if not os.path.exists(self._keys_path):
+            return
+        
+        with open(self._keys_path, "rb") as f:
+            f.seek(self._keys_offset)
+            chunk = f.read()
+        
+        complete = chunk[:chunk.rfind(b"\n") + 1]
+        if not complete:
+            return
+        
+        row = self._disk_rows
+        for line in complete.splitlines():
+            key = line.decode("ascii")
+            if key not in self._disk_index:
+                self._disk_index[key] = row
+            row += 1
+        self._keys_offset += len(complete)
+        self._disk_rows = row
+        
+        self._vectors = np.memmap(
+            self._vectors_path, dtype=np.float32, mode="r", shape=(row, self.dim)
+        )
+    
+    def _append_to_disk(self, keys: List[str], vectors: np.ndarray) -> None:
+        with open(self._lock_path, "a") as lock_file:
+            if fcntl:
+                fcntl.flock(lock_file, fcntl.LOCK_EX)
+            try:
+                self._refresh_disk()
+                
+                fresh = {}
+                for key, vector in zip(keys, vectors):
+                    if key not in self._disk_index and key not in fresh:
+                        fresh[key] = vector
+                if not fresh:
+                    return
+                
+                # Drop rows left behind by a writer that died before
+                # recording their keys, so row numbers stay aligned.
+                with open(self._vectors_path, "ab") as f:
+                    f.truncate(self._disk_rows * self.dim * 4)
+                    f.write(np.stack(list(fresh.values())).astype(np.float32).tobytes())
+                    f.flush()
+                    os.fsync(f.fileno())
+                
+                with open(self._keys_path, "ab") as f:
+                    f.write("".join(f"{key}\n" for key in fresh).encode("ascii"))
+                    f.flush()
+                    os.fsync(f.fileno())
+                
+                self._refresh_disk()
+            finally:
+                if fcntl:
+                    fcntl.flock(lock_file, fcntl.LOCK_UN)
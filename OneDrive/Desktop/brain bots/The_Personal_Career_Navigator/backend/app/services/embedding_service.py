@@ -1,27 +1,71 @@
 # backend/app/services/embedding_service.py
-from sentence_transformers import SentenceTransformer
-from sklearn.metrics.pairwise import cosine_similarity
 import numpy as np
 from typing import List
+from app.core.registry import registry
 
 class EmbeddingService:
-    def __init__(self):
-        self.model = SentenceTransformer('all-MiniLM-L6-v2')
+    def __init__(self, batch_size: int = 256):
+        self.batch_size = batch_size
+    
+    @property
+    def model(self):
+        return registry.get_sentence_model()
+    
+    @property
+    def cache(self):
+        return registry.get_embedding_cache()
     
     def compute_similarity(self, text1: str, text2: str) -> float:
-        embeddings = self.model.encode([text1, text2])
-        similarity = cosine_similarity([embeddings[0]], [embeddings[1]])[0][0]
-        return float(similarity)
+        embeddings = self._encode([text1, text2])
+        return float(embeddings[0] @ embeddings[1])
     
     def compute_skill_importance(self, skill: str, job_descriptions: List[str]) -> float:
-        skill_embedding = self.model.encode([skill])
+        return self.compute_skill_importances([skill], job_descriptions)[0]
+    
+    def compute_skill_importances(
+        self, skills: List[str], job_descriptions: List[str]
+    ) -> List[float]:
+        if not skills:
+            return []
+        if not job_descriptions:
+            return [0.0] * len(skills)
+        
+        skill_embeddings = self._encode(skills)
+        desc_embeddings = self._encode(job_descriptions)
+        
+        similarities = skill_embeddings @ desc_embeddings.T
+        
+        return [float(score) for score in similarities.mean(axis=1)]
+    
+    def encode(self, texts: List[str], use_cache: bool = True) -> np.ndarray:
+        if not use_cache:
+            return self.model.encode(
+                texts,
+                batch_size=self.batch_size,
+                normalize_embeddings=True,
+                convert_to_numpy=True
+            )
+        return self._encode(texts)
+    
+    def _encode(self, texts: List[str]) -> np.ndarray:
+        vectors = self.cache.get_many(texts)
         
-        similarities = []
-        for desc in job_descriptions:
-            desc_embedding = self.model.encode([desc])
-            sim = cosine_similarity(skill_embedding, desc_embedding)[0][0]
-            similarities.append(sim)
+        missing = list(dict.fromkeys(
+            text for text, vector in zip(texts, vectors) if vector is None
+        ))
+        if missing:
+            encoded = self.model.encode(
+                missing,
+                batch_size=self.batch_size,
+                normalize_embeddings=True,
+                convert_to_numpy=True
+            )
+            self.cache.put_many(missing, encoded)
+            
+            encoded_by_text = dict(zip(missing, encoded))
+            vectors = [
+                encoded_by_text[text] if vector is None else vector
+                for text, vector in zip(texts, vectors)
+            ]
         
-        if similarities:
-            return float(np.mean(similarities))
-        return 0.0
\ No newline at end of file
+        return np.vstack(vectors)
@@ -1,33 +1,102 @@
 # backend/app/services/github_service.py
-import requests
-from typing import List, Dict
-from datetime import datetime, timedelta
+import asyncio
+import hashlib
+import time
+import httpx
+from concurrent.futures import ThreadPoolExecutor
+from email.utils import parsedate_to_datetime
+from typing import Any, Coroutine, List, Dict, Optional, Tuple
+from datetime import datetime
 from app.core.config import settings
+from app.services.http_cache import ConditionalResponseCache
+
+MAX_REPO_PAGES = 10
+MAX_RETRIES = 3
+MAX_BACKOFF_SECONDS = 60.0
+
+REPOS_WITH_LANGUAGES_QUERY = """
+query($login: String!, $cursor: String) {
+  user(login: $login) {
+    repositories(first: 100, after: $cursor, ownerAffiliations: OWNER) {
+      pageInfo { hasNextPage endCursor }
+      nodes {
+        name
+        stargazerCount
+        updatedAt
+        primaryLanguage { name }
+        languages(first: 25) { edges { size node { name } } }
+      }
+    }
+  }
+}
+"""
+
+def _run_sync(coro: Coroutine) -> Any:
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return asyncio.run(coro)
+    
+    # Called from inside an event loop: run on a fresh loop in another thread.
+    with ThreadPoolExecutor(max_workers=1) as pool:
+        return pool.submit(asyncio.run, coro).result()
 
 class GitHubService:
-    def __init__(self):
-        self.base_url = "https://api.github.com"
-        self.headers = {
-            "Authorization": f"token {settings.GITHUB_TOKEN}",
-            "Accept": "application/vnd.github.v3+json"
-        }
+    def __init__(
+        self,
+        base_url: str = None,
+        token: str = None,
+        max_concurrency: int = None,
+        timeout: float = None,
+        use_graphql: bool = None,
+        cache: ConditionalResponseCache = None
+    ):
+        self.base_url = (base_url or settings.GITHUB_API_URL).rstrip("/")
+        self.token = settings.GITHUB_TOKEN if token is None else token
+        self.max_concurrency = max_concurrency or settings.GITHUB_MAX_CONCURRENCY
+        self.timeout = timeout or settings.GITHUB_TIMEOUT
+        self.use_graphql = settings.GITHUB_USE_GRAPHQL if use_graphql is None else use_graphql
+        self.headers = {"Accept": "application/vnd.github.v3+json"}
+        if self.token:
+            self.headers["Authorization"] = f"token {self.token}"
+        # Responses can differ per token, so cached entries are scoped to it.
+        self.cache_scope = (
+            hashlib.sha256(self.token.encode()).hexdigest()[:16] if self.token else "anonymous"
+        )
+        
+        self.cache = cache
+        if self.cache is None and settings.GITHUB_CACHE_PATH:
+            self.cache = ConditionalResponseCache(
+                settings.GITHUB_CACHE_PATH, settings.GITHUB_CACHE_MAX_BYTES
+            )
     
+    # The sync wrappers are for threads and Celery workers. Async routes
+    # should await the *_async methods instead of blocking their loop.
     def extract_skills(self, username: str) -> List[Dict]:
-        skills = []
-        
-        repos = self._get_user_repos(username)
+        return _run_sync(self.extract_skills_async(username))
+    
+    def fingerprint(self, username: str, timeout: float = None) -> Optional[str]:
+        return _run_sync(asyncio.wait_for(self.fingerprint_async(username), timeout))
+    
+    def invalidate(self, username: str) -> None:
+        if self.cache is not None:
+            self.cache.invalidate_owner(username)
+    
+    async def extract_skills_async(self, username: str) -> List[Dict]:
+        async with self._client() as client:
+            if self.use_graphql and self.token:
+                repos, repo_languages = await self._get_repos_with_languages(client, username)
+            else:
+                repos = await self._get_user_repos(client, username)
+                semaphore = asyncio.Semaphore(self.max_concurrency)
+                repo_languages = await asyncio.gather(*[
+                    self._get_repo_languages(client, semaphore, username, repo["name"])
+                    for repo in repos
+                ])
         
-        language_counts = {}
-        tech_stack = set()
+        skills = []
         
-        for repo in repos:
-            if repo.get("language"):
-                lang = repo["language"]
-                language_counts[lang] = language_counts.get(lang, 0) + 1
-            
-            languages = self._get_repo_languages(username, repo["name"])
-            tech_stack.update(languages.keys())
-            
+        for repo, languages in zip(repos, repo_languages):
             updated_at = datetime.strptime(repo["updated_at"], "%Y-%m-%dT%H:%M:%SZ")
             recency_weight = self._calculate_recency_weight(updated_at)
             
@@ -45,20 +114,162 @@ class GitHubService:
         
         return skills
     
-    def _get_user_repos(self, username: str) -> List[Dict]:
-        url = f"{self.base_url}/users/{username}/repos"
-        response = requests.get(url, headers=self.headers)
-        if response.status_code == 200:
-            return response.json()
-        return []
+    async def fingerprint_async(self, username: str) -> Optional[str]:
+        # The most recently pushed repo changes on any push or new repo; with
+        # the response cache this is a conditional request answered by 304.
+        async with self._client() as client:
+            response = await self._request(
+                client, "GET", f"/users/{username}/repos", owner=username,
+                params={"per_page": 1, "sort": "pushed"}
+            )
+        if response is None or response.status_code != 200:
+            return None
+        return response.headers.get("etag")
+    
+    def _client(self) -> httpx.AsyncClient:
+        return httpx.AsyncClient(
+            base_url=self.base_url,
+            headers=self.headers,
+            timeout=httpx.Timeout(self.timeout),
+            limits=httpx.Limits(
+                max_connections=self.max_concurrency,
+                max_keepalive_connections=self.max_concurrency
+            )
+        )
+    
+    async def _get_user_repos(self, client: httpx.AsyncClient, username: str) -> List[Dict]:
+        repos = []
+        url = f"/users/{username}/repos"
+        params = {"per_page": 100}
+        
+        for _ in range(MAX_REPO_PAGES):
+            response = await self._request(client, "GET", url, owner=username, params=params)
+            if response is None or response.status_code != 200:
+                break
+            
+            repos.extend(response.json())
+            
+            next_link = response.links.get("next")
+            if not next_link:
+                break
+            url, params = next_link["url"], None
+        
+        return repos
     
-    def _get_repo_languages(self, username: str, repo_name: str) -> Dict:
-        url = f"{self.base_url}/repos/{username}/{repo_name}/languages"
-        response = requests.get(url, headers=self.headers)
-        if response.status_code == 200:
+    async def _get_repo_languages(
+        self, client: httpx.AsyncClient, semaphore: asyncio.Semaphore, username: str, repo_name: str
+    ) -> Dict:
+        async with semaphore:
+            response = await self._request(
+                client, "GET", f"/repos/{username}/{repo_name}/languages", owner=username
+            )
+        if response is not None and response.status_code == 200:
             return response.json()
         return {}
     
+    async def _get_repos_with_languages(
+        self, client: httpx.AsyncClient, username: str
+    ) -> Tuple[List[Dict], List[Dict]]:
+        repos, repo_languages = [], []
+        cursor = None
+        
+        for _ in range(MAX_REPO_PAGES):
+            response = await self._request(client, "POST", "/graphql", json={
+                "query": REPOS_WITH_LANGUAGES_QUERY,
+                "variables": {"login": username, "cursor": cursor}
+            })
+            if response is None or response.status_code != 200:
+                break
+            
+            user = (response.json().get("data") or {}).get("user")
+            if not user:
+                break
+            
+            page = user["repositories"]
+            for node in page["nodes"]:
+                repos.append({
+                    "name": node["name"],
+                    "stargazers_count": node["stargazerCount"],
+                    "updated_at": node["updatedAt"],
+                    "language": (node.get("primaryLanguage") or {}).get("name")
+                })
+                repo_languages.append({
+                    edge["node"]["name"]: edge["size"] for edge in node["languages"]["edges"]
+                })
+            
+            if not page["pageInfo"]["hasNextPage"]:
+                break
+            cursor = page["pageInfo"]["endCursor"]
+        
+        return repos, repo_languages
+    
+    async def _request(
+        self, client: httpx.AsyncClient, method: str, url: str, owner: str = None, **kwargs
+    ) -> Optional[httpx.Response]:
+        cache_key, cached, headers = None, None, {}
+        if method == "GET" and self.cache is not None:
+            cache_key = f"{self.cache_scope}:{client.build_request(method, url, **kwargs).url}"
+            # Cache I/O runs on this loop's own executor, never the shared
+            # request pool, which may be the very thread waiting on this call.
+            cached = await asyncio.to_thread(self.cache.get, cache_key)
+            if cached is not None:
+                headers = cached.conditional_headers()
+        
+        for attempt in range(MAX_RETRIES + 1):
+            try:
+                response = await client.request(method, url, headers=headers, **kwargs)
+            except httpx.TransportError as e:
+                if attempt == MAX_RETRIES:
+                    print(f"Error calling GitHub API: {e}")
+                    return None
+                await asyncio.sleep(0.5 * 2 ** attempt)
+                continue
+            
+            if response.status_code == 304 and cached is not None:
+                self.cache.revalidated += 1
+                return httpx.Response(
+                    200, headers=cached.headers, content=cached.body, request=response.request
+                )
+            
+            if response.status_code == 200 and cache_key is not None:
+                await asyncio.to_thread(
+                    self.cache.put, cache_key, owner, response.headers, response.content
+                )
+            
+            if attempt == MAX_RETRIES:
+                return response
+            
+            if response.status_code in (403, 429):
+                delay = self._rate_limit_delay(response)
+                if delay is None or delay > MAX_BACKOFF_SECONDS:
+                    return response
+                await asyncio.sleep(delay)
+            elif response.status_code >= 500:
+                await asyncio.sleep(0.5 * 2 ** attempt)
+            else:
+                return response
+        
+        return None
+    
+    def _rate_limit_delay(self, response: httpx.Response) -> Optional[float]:
+        retry_after = response.headers.get("retry-after")
+        if retry_after is not None:
+            try:
+                return max(float(retry_after), 0.0)
+            except ValueError:
+                pass
+            try:
+                # Retry-After may also be an HTTP date.
+                return max(parsedate_to_datetime(retry_after).timestamp() - time.time(), 0.0)
+            except (TypeError, ValueError):
+                return None
+        
+        if response.headers.get("x-ratelimit-remaining") == "0":
+            reset_at = float(response.headers.get("x-ratelimit-reset", 0))
+            return max(reset_at - time.time(), 0.0) + 1.0
+        
+        return None
+    
     def _calculate_recency_weight(self, updated_at: datetime) -> float:
         now = datetime.utcnow()
         days_ago = (now - updated_at).days
@@ -72,4 +283,4 @@ class GitHubService:
         elif days_ago <= 365:
             return 0.3
         else:
-            return 0.1
\ No newline at end of file
+            return 0.1
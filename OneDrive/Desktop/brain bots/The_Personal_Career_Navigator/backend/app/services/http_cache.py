@@ -0,0 +1,133 @@
+# backend/app/services/http_cache.py
+import json
+import os
+import sqlite3
+import time
+from contextlib import contextmanager
+from typing import Dict, Iterator, Optional
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS responses (
+    url TEXT PRIMARY KEY,
+    owner TEXT,
+    etag TEXT,
+    last_modified TEXT,
+    headers TEXT,
+    body BLOB,
+    size INTEGER,
+    last_used REAL
+);
+CREATE INDEX IF NOT EXISTS ix_responses_owner ON responses (owner);
+CREATE INDEX IF NOT EXISTS ix_responses_last_used ON responses (last_used);
+"""
+
+KEPT_HEADERS = ("content-type", "link", "etag", "last-modified")
+
+class CachedResponse:
+    def __init__(self, etag: str, last_modified: str, headers: Dict[str, str], body: bytes):
+        self.etag = etag
+        self.last_modified = last_modified
+        self.headers = headers
+        self.body = body
+
+    def conditional_headers(self) -> Dict[str, str]:
+        headers = {}
+        if self.etag:
+            headers["If-None-Match"] = self.etag
+        if self.last_modified:
+            headers["If-Modified-Since"] = self.last_modified
+        return headers
+
+class ConditionalResponseCache:
+    """SQLite-backed store of validated HTTP responses.
+
+    Bodies are kept with their ETag and Last-Modified values so callers can
+    revalidate with a conditional request and reuse the body on 304. The
+    store is shared by every process on the host, evicts least recently
+    used entries beyond max_bytes, and can drop everything cached for one
+    owner (a GitHub user, matched case-insensitively like GitHub logins).
+    Calls block on SQLite, so async callers should run them off the loop.
+    """
+
+    def __init__(self, path: str, max_bytes: int):
+        self.path = path
+        self.max_bytes = max_bytes
+
+        self.revalidated = 0
+        self.stored = 0
+
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        with self._connect() as conn:
+            conn.executescript(SCHEMA)
+
+    def get(self, url: str) -> Optional[CachedResponse]:
+        with self._connect() as conn:
+            row = conn.execute(
+                "SELECT etag, last_modified, headers, body FROM responses WHERE url = ?", (url,)
+            ).fetchone()
+            if row is None:
+                return None
+            conn.execute("UPDATE responses SET last_used = ? WHERE url = ?", (time.time(), url))
+
+        etag, last_modified, headers, body = row
+        return CachedResponse(etag, last_modified, json.loads(headers), body)
+
+    def put(self, url: str, owner: str, headers: Dict[str, str], body: bytes) -> None:
+        etag = headers.get("etag")
+        last_modified = headers.get("last-modified")
+        if not etag and not last_modified:
+            return
+
+        kept = {k: headers[k] for k in KEPT_HEADERS if k in headers}
+        with self._connect() as conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO responses "
+                "(url, owner, etag, last_modified, headers, body, size, last_used) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                (url, (owner or "").lower(), etag, last_modified, json.dumps(kept), body,
+                 len(body), time.time())
+            )
+            self._evict(conn)
+        self.stored += 1
+
+    def invalidate_owner(self, owner: str) -> None:
+        with self._connect() as conn:
+            conn.execute("DELETE FROM responses WHERE lower(owner) = ?", (owner.lower(),))
+
+    def stats(self) -> Dict:
+        with self._connect() as conn:
+            entries, size = conn.execute(
+                "SELECT COUNT(*), COALESCE(SUM(size), 0) FROM responses"
+            ).fetchone()
+        return {
+            "revalidated": self.revalidated,
+            "stored": self.stored,
+            "entries": entries,
+            "bytes": size,
+            "max_bytes": self.max_bytes
+        }
+
+    def _evict(self, conn: sqlite3.Connection) -> None:
+        total = conn.execute("SELECT COALESCE(SUM(size), 0) FROM responses").fetchone()[0]
+        if total <= self.max_bytes:
+            return
+
+        evicted = []
+        for url, size in conn.execute("SELECT url, size FROM responses ORDER BY last_used"):
+            if total <= self.max_bytes:
+                break
+            evicted.append((url,))
+            total -= size
+        conn.executemany("DELETE FROM responses WHERE url = ?", evicted)
+
+    @contextmanager
+    def _connect(self) -> Iterator[sqlite3.Connection]:
+        conn = sqlite3.connect(self.path, timeout=5.0)
+        try:
+            conn.execute("PRAGMA journal_mode=WAL")
+            with conn:
+                yield conn
+        finally:
+            conn.close()
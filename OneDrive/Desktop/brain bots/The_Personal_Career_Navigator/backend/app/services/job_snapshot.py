@@ -0,0 +1,171 @@
+# backend/app/services/job_snapshot.py
+import hashlib
+import json
+import os
+import threading
+from typing import Dict, Optional
+import pandas as pd
+import pyarrow as pa
+from app.core.config import settings
+
+try:
+    import fcntl
+except ImportError:
+    fcntl = None
+
+SNAPSHOT_COLUMNS = ["title", "description", "skills", "company", "location"]
+CSV_CHUNK_ROWS = 50000
+
+_tables: Dict[str, pa.Table] = {}
+_tables_lock = threading.Lock()
+
+class JobPostingsSnapshot:
+    """Arrow IPC snapshot of the Kaggle postings CSV.
+
+    The CSV is converted once, in chunks, into an uncompressed Arrow file
+    that every worker memory-maps, so only the pages a lookup touches are
+    read. The snapshot is rebuilt when the source's size or mtime changes
+    and its sha256 no longer matches the one recorded at build time.
+    """
+
+    def __init__(self, source_path: str = None, snapshot_path: str = None):
+        self.source_path = source_path or settings.KAGGLE_DATASET_PATH
+        self.snapshot_path = (
+            snapshot_path or settings.KAGGLE_SNAPSHOT_PATH or f"{self.source_path}.arrow"
+        )
+        self.meta_path = f"{self.snapshot_path}.meta.json"
+        self.lock_path = f"{self.snapshot_path}.lock"
+
+    def load(self) -> pa.Table:
+        self.ensure()
+
+        key = self.version()
+        with _tables_lock:
+            if key not in _tables:
+                for stale in [k for k in _tables if k.startswith(f"{self.snapshot_path}:")]:
+                    del _tables[stale]
+                source = pa.memory_map(self.snapshot_path, "r")
+                _tables[key] = pa.ipc.open_file(source).read_all()
+            return _tables[key]
+
+    def version(self) -> str:
+        return f"{self.snapshot_path}:{os.stat(self.snapshot_path).st_mtime_ns}"
+
+    def ensure(self) -> bool:
+        if self.is_fresh():
+            return False
+
+        with open(self.lock_path, "a") as lock_file:
+            if fcntl:
+                fcntl.flock(lock_file, fcntl.LOCK_EX)
+            try:
+                if self.is_fresh():
+                    return False
+                self.build()
+                return True
+            finally:
+                if fcntl:
+                    fcntl.flock(lock_file, fcntl.LOCK_UN)
+
+    def is_fresh(self) -> bool:
+        meta = self._read_meta()
+        if not meta or not os.path.exists(self.snapshot_path):
+            return False
+
+        stat = os.stat(self.source_path)
+        if meta["source_size"] == stat.st_size and meta["source_mtime_ns"] == stat.st_mtime_ns:
+            return True
+
+        if meta["source_size"] != stat.st_size:
+            return False
+
+        if meta["source_sha256"] != self._hash_source():
+            return False
+
+        meta["source_mtime_ns"] = stat.st_mtime_ns
+        self._write_meta(meta)
+        return True
+
+    def build(self) -> None:
+        stat = os.stat(self.source_path)
+        tmp_path = f"{self.snapshot_path}.tmp"
+
+        header = pd.read_csv(self.source_path, nrows=0).columns
+        columns = [c for c in SNAPSHOT_COLUMNS if c in header]
+        schema = pa.schema([(c, pa.string()) for c in columns])
+
+        rows = 0
+        with pa.OSFile(tmp_path, "wb") as sink:
+            with pa.ipc.new_file(sink, schema) as writer:
+                for chunk in pd.read_csv(
+                    self.source_path, usecols=columns, dtype=str, chunksize=CSV_CHUNK_ROWS
+                ):
+                    writer.write_table(
+                        pa.Table.from_pandas(chunk[columns], schema=schema, preserve_index=False)
+                    )
+                    rows += len(chunk)
+
+        os.replace(tmp_path, self.snapshot_path)
+        self._write_meta({
+            "source_path": os.path.abspath(self.source_path),
+            "source_size": stat.st_size,
+            "source_mtime_ns": stat.st_mtime_ns,
+            "source_sha256": self._hash_source(),
+            "rows": rows,
+            "columns": columns
+        })
+
+    def source_info(self) -> Dict:
+        meta = self._read_meta() or {}
+        return {"size": meta.get("source_size"), "sha256": meta.get("source_sha256")}
+
+    def extends(self, size: Optional[int], sha256: Optional[str]) -> bool:
+        """Whether the source still starts with the bytes a build saw.
+
+        Consumers that index snapshot rows by position use this to tell an
+        append-only change, where their rows are still valid, from an edit
+        or reorder that needs a full rebuild.
+        """
+        if size is None or not sha256:
+            return False
+        try:
+            if os.path.getsize(self.source_path) < size:
+                return False
+            return self._hash_source(size) == sha256
+        except OSError:
+            return False
+
+    def _hash_source(self, size: int = None) -> str:
+        digest = hashlib.sha256()
+        remaining = size
+        with open(self.source_path, "rb") as f:
+            while remaining is None or remaining > 0:
+                block = f.read(1 << 20 if remaining is None else min(1 << 20, remaining))
+                if not block:
+                    break
+                digest.update(block)
+                if remaining is not None:
+                    remaining -= len(block)
+        return digest.hexdigest()
+
+    def _read_meta(self) -> Optional[Dict]:
+        try:
+            with open(self.meta_path, "r") as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return None
+
+    def _write_meta(self, meta: Dict) -> None:
+        tmp_path = f"{self.meta_path}.tmp"
+        with open(tmp_path, "w") as f:
+            json.dump(meta, f)
+        os.replace(tmp_path, self.meta_path)
+
+if __name__ == "__main__":
+    snapshot = JobPostingsSnapshot()
+    rebuilt = snapshot.ensure()
+    print(f"{'Built' if rebuilt else 'Up to date'}: {snapshot.snapshot_path}")
+
+    from app.services.title_index import build_title_index, title_index_path
+    build_title_index(snapshot)
+    print(f"Title index: {title_index_path(snapshot)}")
@@ -1,11 +1,26 @@
 # backend/app/services/kaggle_loader.py
-import pandas as pd
+import os
 from typing import List, Dict
 from app.core.config import settings
+from app.services.job_snapshot import JobPostingsSnapshot
+from app.services.title_index import get_title_index
+from app.services.vector_index import get_vector_index
 
 class KaggleLoader:
     def __init__(self):
         self.dataset_path = settings.KAGGLE_DATASET_PATH
+        self.snapshot = JobPostingsSnapshot(self.dataset_path)
+    
+    def dataset_version(self) -> str:
+        # Keyed on the source CSV, not the snapshot, so an edited CSV takes
+        # effect before anyone rebuilds the snapshot.
+        if not self.dataset_path:
+            return "mock"
+        try:
+            stat = os.stat(self.dataset_path)
+        except OSError:
+            return "missing"
+        return f"{os.path.abspath(self.dataset_path)}:{stat.st_size}:{stat.st_mtime_ns}"
     
     def load_job_postings(self, role: str) -> List[Dict]:
         # TODO: DATASET_PATH - Configure actual Kaggle dataset path
@@ -14,19 +29,19 @@ class KaggleLoader:
             return self._get_mock_data(role)
         
         try:
-            df = pd.read_csv(self.dataset_path)
+            table = self.snapshot.load()
+            title_index = get_title_index(self.snapshot)
             
-            role_lower = role.lower()
-            filtered = df[df["title"].str.lower().str.contains(role_lower, na=False)]
+            row_ids = title_index.search(role, limit=100)
             
             jobs = []
-            for _, row in filtered.head(100).iterrows():
+            for row in table.take(row_ids).to_pylist():
                 jobs.append({
-                    "title": row.get("title", ""),
-                    "description": row.get("description", ""),
-                    "skills_required": row.get("skills", ""),
-                    "company": row.get("company", ""),
-                    "location": row.get("location", "")
+                    "title": row.get("title") or "",
+                    "description": row.get("description") or "",
+                    "skills_required": row.get("skills") or "",
+                    "company": row.get("company") or "",
+                    "location": row.get("location") or ""
                 })
             
             return jobs
@@ -35,6 +50,33 @@ class KaggleLoader:
             print(f"Error loading Kaggle dataset: {e}")
             return self._get_mock_data(role)
     
+    def search_postings(self, query: str, k: int = 10) -> List[Dict]:
+        if not self.dataset_path:
+            return []
+        
+        try:
+            vector_index = get_vector_index()
+            if vector_index is None:
+                return []
+            
+            row_ids = [row for row, _ in vector_index.search(query, k=k)]
+            table = self.snapshot.load()
+            
+            return [
+                {
+                    "title": row.get("title") or "",
+                    "description": row.get("description") or "",
+                    "skills_required": row.get("skills") or "",
+                    "company": row.get("company") or "",
+                    "location": row.get("location") or ""
+                }
+                for row in table.take(row_ids).to_pylist()
+            ]
+        
+        except Exception as e:
+            print(f"Error searching job postings: {e}")
+            return []
+    
     def _get_mock_data(self, role: str) -> List[Dict]:
         # MOCK_DATA
         mock_jobs = {
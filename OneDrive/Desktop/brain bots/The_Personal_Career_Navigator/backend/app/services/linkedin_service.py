@@ -1,64 +1,116 @@
 # backend/app/services/linkedin_service.py
-import json
-from typing import List, Dict
+import gzip
+from typing import BinaryIO, Iterator, List, Dict, Tuple
+import ijson
+from app.services.skill_matcher import get_skill_matcher
+
+GZIP_MAGIC = b"\x1f\x8b"
+# Export sections streamed entry by entry; everything else is skipped.
+ENTRY_PREFIXES = {"skills.item": "skill", "experience.item": "experience"}
+
+def listed_skill_entry(skill_item: Dict) -> Dict:
+    endorsements = skill_item.get("endorsements", 0)
+    
+    level = min(endorsements / 20.0, 1.0)
+    
+    return {
+        "skill": skill_item.get("name", ""),
+        "source": "linkedin",
+        "evidence": {
+            "endorsements": endorsements,
+            "level": level
+        }
+    }
+
+def experience_skill_entries(exp: Dict, extracted: List[str]) -> List[Dict]:
+    return [
+        {
+            "skill": skill,
+            "source": "linkedin_experience",
+            "evidence": {
+                "company": exp.get("company", ""),
+                "title": exp.get("title", "")
+            }
+        }
+        for skill in extracted
+    ]
+
+def open_export(path: str) -> BinaryIO:
+    f = open(path, "rb")
+    if f.read(2) == GZIP_MAGIC:
+        f.close()
+        return gzip.open(path, "rb")
+    f.seek(0)
+    return f
+
+def iter_export_entries(path: str) -> Iterator[Tuple[int, str, Dict]]:
+    """Stream (profile, kind, entry) tuples out of a LinkedIn export.
+    
+    The file is read as JSON parse events and only the entry being built
+    is held in memory. Gzip-compressed files and newline-delimited files
+    with one profile per line are accepted; profile counts the top-level
+    documents seen so far.
+    """
+    profile = -1
+    builder, building = None, None
+    
+    with open_export(path) as f:
+        for prefix, event, value in ijson.parse(f, multiple_values=True, use_float=True):
+            if builder is not None:
+                builder.event(event, value)
+                if prefix == building and event == "end_map":
+                    yield profile, ENTRY_PREFIXES[building], builder.value
+                    builder, building = None, None
+            elif event == "start_map":
+                if prefix == "":
+                    profile += 1
+                elif prefix in ENTRY_PREFIXES:
+                    builder, building = ijson.ObjectBuilder(), prefix
+                    builder.event(event, value)
+            elif prefix == "skills.item" and event == "string":
+                # Skills listed as plain names, e.g. {"skills": ["Python"]}.
+                yield profile, "skill", {"name": value}
+
+def first_profile_entries(path: str) -> Iterator[Tuple[str, Dict]]:
+    """(kind, entry) tuples of the export's first profile only.
+    
+    An upload belongs to one user, so the profiles after the first one in a
+    newline-delimited file are skipped rather than merged into that user.
+    """
+    for profile, kind, entry in iter_export_entries(path):
+        if profile > 0:
+            print(f"LinkedIn export {path} holds more than one profile, using the first")
+            return
+        yield kind, entry
+
+def count_export_profiles(path: str) -> int:
+    profiles = 0
+    with open_export(path) as f:
+        for prefix, event, _ in ijson.parse(f, multiple_values=True):
+            if prefix == "" and event == "start_map":
+                profiles += 1
+    return profiles
 
 class LinkedInService:
     def extract_skills(self, json_path: str) -> List[Dict]:
         skills = []
         
         try:
-            with open(json_path, 'r') as f:
-                data = json.load(f)
-            
-            if "skills" in data:
-                for skill_item in data["skills"]:
-                    skill_name = skill_item.get("name", "")
-                    endorsements = skill_item.get("endorsements", 0)
-                    
-                    level = min(endorsements / 20.0, 1.0)
-                    
-                    skills.append({
-                        "skill": skill_name,
-                        "source": "linkedin",
-                        "evidence": {
-                            "endorsements": endorsements,
-                            "level": level
-                        }
-                    })
-            
-            if "experience" in data:
-                for exp in data["experience"]:
-                    description = exp.get("description", "")
-                    extracted = self._extract_skills_from_text(description)
-                    
-                    for skill in extracted:
-                        skills.append({
-                            "skill": skill,
-                            "source": "linkedin_experience",
-                            "evidence": {
-                                "company": exp.get("company", ""),
-                                "title": exp.get("title", "")
-                            }
-                        })
+            for skill in self.iter_skills(json_path):
+                skills.append(skill)
         
         except Exception as e:
             print(f"Error extracting LinkedIn skills: {e}")
         
         return skills
     
+    def iter_skills(self, json_path: str) -> Iterator[Dict]:
+        for kind, entry in first_profile_entries(json_path):
+            if kind == "skill":
+                yield listed_skill_entry(entry)
+            else:
+                extracted = self._extract_skills_from_text(entry.get("description", ""))
+                yield from experience_skill_entries(entry, extracted)
+    
     def _extract_skills_from_text(self, text: str) -> List[str]:
-        common_skills = [
-            "Python", "JavaScript", "Java", "C++", "React", "Node.js",
-            "Docker", "Kubernetes", "AWS", "Azure", "SQL", "PostgreSQL",
-            "MongoDB", "Machine Learning", "Deep Learning", "NLP",
-            "Data Science", "Analytics", "Leadership", "Agile"
-        ]
-        
-        found_skills = []
-        text_lower = text.lower()
-        
-        for skill in common_skills:
-            if skill.lower() in text_lower:
-                found_skills.append(skill)
-        
-        return found_skills
\ No newline at end of file
+        return get_skill_matcher().find(text)
\ No newline at end of file
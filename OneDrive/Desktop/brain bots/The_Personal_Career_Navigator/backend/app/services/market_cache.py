@@ -0,0 +1,227 @@
+# backend/app/services/market_cache.py
+import json
+import threading
+import time
+import uuid
+from typing import Callable, Dict, Optional
+import redis
+from app.core.config import settings
+from app.services.market_profiles import role_cluster_key
+
+GENERATION_KEY = "market:generation"
+MAX_MEMORY_ENTRIES = 1024
+RECONNECT_MIN_SECONDS = 1.0
+RECONNECT_MAX_SECONDS = 60.0
+
+_RELEASE_LOCK = """
+if redis.call("get", KEYS[1]) == ARGV[1] then
+    return redis.call("del", KEYS[1])
+end
+return 0
+"""
+
+class MarketAnalysisCache:
+    """Market analysis results keyed by normalized role and dataset version.
+
+    Entries live in Redis when it is reachable, so every uvicorn and Celery
+    worker shares them, and in process memory otherwise. Concurrent misses
+    for the same key are collapsed: one caller computes while the others
+    wait for its result, within the process through a lock per key and
+    across processes through a short-lived Redis lock. If Redis is down,
+    reconnects are retried with exponential backoff on later calls.
+    """
+
+    def __init__(self, redis_url: str = None, ttl: int = None, lock_timeout: float = 60.0):
+        self.ttl = ttl or settings.MARKET_CACHE_TTL
+        self.lock_timeout = lock_timeout
+
+        self.hits = 0
+        self.misses = 0
+
+        self._memory: Dict[str, tuple] = {}
+        self._memory_generation = 0
+        self._lock = threading.Lock()
+        self._key_locks: Dict[str, threading.Lock] = {}
+
+        self._redis_url = redis_url or settings.REDIS_URL
+        self._redis: Optional[redis.Redis] = None
+        self._reconnect_delay = RECONNECT_MIN_SECONDS
+        self._reconnect_at = 0.0
+        self._connect_lock = threading.Lock()
+        self._client()
+
+    def get_or_compute(
+        self, role: str, dataset_version: str, compute: Callable[[], Dict]
+    ) -> Dict:
+        key = self.key_for(role, dataset_version)
+
+        value = self._get(key)
+        if value is None:
+            with self._key_lock(key):
+                value = self._get(key)
+                if value is None:
+                    value = self._compute_once(key, compute)
+                else:
+                    self._count("hits")
+            with self._lock:
+                self._key_locks.pop(key, None)
+        else:
+            self._count("hits")
+
+        return {**value, "role": role}
+
+    def key_for(self, role: str, dataset_version: str) -> str:
+        return f"market:{self._generation()}:{dataset_version}:{role_cluster_key(role)}"
+
+    def invalidate(self) -> None:
+        with self._lock:
+            self._memory.clear()
+            self._memory_generation += 1
+
+        client = self._client()
+        if client is not None:
+            try:
+                client.incr(GENERATION_KEY)
+            except redis.RedisError as e:
+                print(f"Error invalidating market cache: {e}")
+                self._drop(client)
+
+    def stats(self) -> Dict:
+        return {
+            "backend": "redis" if self._redis is not None else "memory",
+            "hits": self.hits,
+            "misses": self.misses,
+            "memory_entries": len(self._memory)
+        }
+
+    def _client(self) -> Optional[redis.Redis]:
+        if self._redis is not None or not self._redis_url:
+            return self._redis
+
+        now = time.monotonic()
+        if now < self._reconnect_at:
+            return None
+        with self._connect_lock:
+            if self._redis is None and now >= self._reconnect_at:
+                self._redis = self._connect(self._redis_url)
+                if self._redis is None:
+                    self._back_off(now)
+                else:
+                    self._reconnect_delay = RECONNECT_MIN_SECONDS
+        return self._redis
+
+    def _drop(self, client: redis.Redis) -> None:
+        # A failed command means Redis went away: fall back to memory and
+        # retry the connection with the same backoff as the first connect.
+        with self._connect_lock:
+            if self._redis is client:
+                print("Redis unavailable, caching market analysis in memory")
+                self._redis = None
+                self._back_off(time.monotonic())
+
+    def _back_off(self, now: float) -> None:
+        self._reconnect_at = now + self._reconnect_delay
+        self._reconnect_delay = min(self._reconnect_delay * 2, RECONNECT_MAX_SECONDS)
+
+    def _count(self, counter: str) -> None:
+        # Callers run on several threads; += on an attribute is not atomic.
+        with self._lock:
+            setattr(self, counter, getattr(self, counter) + 1)
+
+    def _connect(self, redis_url: str) -> Optional[redis.Redis]:
+        try:
+            client = redis.Redis.from_url(redis_url, socket_timeout=0.5, socket_connect_timeout=0.5)
+            client.ping()
+            return client
+        except redis.RedisError as e:
+            print(f"Redis unavailable, caching market analysis in memory: {e}")
+            return None
+
+    def _generation(self) -> str:
+        client = self._client()
+        if client is not None:
+            try:
+                return (client.get(GENERATION_KEY) or b"0").decode()
+            except redis.RedisError:
+                self._drop(client)
+        return str(self._memory_generation)
+
+    def _key_lock(self, key: str) -> threading.Lock:
+        with self._lock:
+            if key not in self._key_locks:
+                self._key_locks[key] = threading.Lock()
+            return self._key_locks[key]
+
+    def _get(self, key: str) -> Optional[Dict]:
+        client = self._client()
+        if client is not None:
+            try:
+                raw = client.get(key)
+                return json.loads(raw) if raw is not None else None
+            except redis.RedisError:
+                self._drop(client)
+
+        entry = self._memory.get(key)
+        if entry is None:
+            return None
+        expires_at, value = entry
+        if expires_at < time.monotonic():
+            self._memory.pop(key, None)
+            return None
+        return value
+
+    def _set(self, key: str, value: Dict) -> None:
+        client = self._client()
+        if client is not None:
+            try:
+                client.set(key, json.dumps(value), ex=self.ttl)
+                return
+            except redis.RedisError:
+                self._drop(client)
+
+        with self._lock:
+            now = time.monotonic()
+            if len(self._memory) >= MAX_MEMORY_ENTRIES:
+                for stale in [k for k, (expires_at, _) in self._memory.items() if expires_at < now]:
+                    del self._memory[stale]
+            if len(self._memory) >= MAX_MEMORY_ENTRIES:
+                self._memory.pop(next(iter(self._memory)))
+            self._memory[key] = (now + self.ttl, value)
+
+    def _compute_once(self, key: str, compute: Callable[[], Dict]) -> Dict:
+        lock_key = f"{key}:lock"
+        token = uuid.uuid4().hex
+        acquired = False
+
+        client = self._client()
+        if client is not None:
+            try:
+                deadline = time.monotonic() + self.lock_timeout
+                while True:
+                    acquired = bool(client.set(
+                        lock_key, token, nx=True, px=int(self.lock_timeout * 1000)
+                    ))
+                    if acquired:
+                        break
+                    time.sleep(0.05)
+                    value = self._get(key)
+                    if value is not None:
+                        self._count("hits")
+                        return value
+                    if time.monotonic() > deadline:
+                        break
+            except redis.RedisError:
+                acquired = False
+                self._drop(client)
+
+        try:
+            self._count("misses")
+            value = compute()
+            self._set(key, value)
+            return value
+        finally:
+            if acquired:
+                try:
+                    client.eval(_RELEASE_LOCK, 1, lock_key, token)
+                except redis.RedisError:
+                    self._drop(client)
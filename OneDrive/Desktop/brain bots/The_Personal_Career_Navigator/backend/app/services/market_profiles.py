@@ -0,0 +1,229 @@
+# backend/app/services/market_profiles.py
+import argparse
+from collections import Counter
+from datetime import datetime
+from typing import Dict, List, Optional
+from sqlalchemy.orm import Session
+from app.core.registry import registry
+from app.models.market_profile import MarketProfile, MarketProfileRun
+from app.services.job_snapshot import JobPostingsSnapshot
+from app.services.title_index import normalize_title
+
+SENIORITY_TOKENS = {
+    "senior", "junior", "lead", "principal", "staff", "intern", "associate",
+    "entry", "level", "mid", "i", "ii", "iii", "iv"
+}
+BATCH_ROWS = 50000
+# Role aggregates held before they are folded into the database.
+MAX_ROLES_IN_MEMORY = 20000
+SAMPLE_DESCRIPTIONS = 10
+MIN_PROFILE_JOBS = 3
+PERSIST_BATCH = 500
+
+def role_cluster_key(title: str) -> str:
+    return " ".join(t for t in normalize_title(title) if t not in SENIORITY_TOKENS)
+
+def parse_skills(skills_str: str) -> List[str]:
+    return [s.strip() for s in (skills_str or "").split(",") if s.strip()]
+
+class RoleAggregate:
+    __slots__ = ("role_title", "total_jobs", "skill_counts", "sample_descriptions")
+
+    def __init__(self, role_title: str):
+        self.role_title = role_title
+        self.total_jobs = 0
+        self.skill_counts = Counter()
+        self.sample_descriptions = []
+
+    def add(self, skills: List[str], description: str) -> None:
+        self.total_jobs += 1
+        self.skill_counts.update(skills)
+        if description and len(self.sample_descriptions) < SAMPLE_DESCRIPTIONS:
+            self.sample_descriptions.append(description)
+
+class MarketProfileBuilder:
+    """Single-pass aggregation of the postings snapshot into per-role profiles.
+
+    Postings are streamed from the memory-mapped snapshot in record
+    batches and grouped by role cluster (normalized title without
+    seniority words). Skill counts are exact. At most MAX_ROLES_IN_MEMORY
+    role aggregates are held at once; past that they are folded into the
+    stored profiles and cleared. Incremental runs only read rows appended
+    since the last completed run, and only when the source CSV still starts
+    with the bytes that run saw; otherwise they fall back to a full pass.
+    """
+
+    def __init__(self, snapshot: JobPostingsSnapshot = None):
+        self.snapshot = snapshot or JobPostingsSnapshot()
+
+    def run(self, db: Session, incremental: bool = True) -> Dict:
+        if not self.snapshot.source_path:
+            raise ValueError("KAGGLE_DATASET_PATH is not configured")
+
+        table = self.snapshot.load()
+        version = self.snapshot.version()
+        source = self.snapshot.source_info()
+
+        start = 0
+        if incremental:
+            last_run = db.query(MarketProfileRun).filter(
+                MarketProfileRun.status == "completed"
+            ).order_by(MarketProfileRun.id.desc()).first()
+            if (
+                last_run
+                and last_run.rows_processed <= table.num_rows
+                and self.snapshot.extends(last_run.source_size, last_run.source_sha256)
+            ):
+                start = last_run.rows_processed
+
+        run = MarketProfileRun(
+            dataset_version=version,
+            source_size=source["size"],
+            source_sha256=source["sha256"],
+            incremental=start > 0
+        )
+        db.add(run)
+        db.commit()
+
+        try:
+            roles_updated = self._aggregate(table, start, version, db)
+        except Exception:
+            db.rollback()
+            run.status = "failed"
+            run.finished_at = datetime.utcnow()
+            db.commit()
+            raise
+
+        run.rows_processed = table.num_rows
+        run.status = "completed"
+        run.finished_at = datetime.utcnow()
+        db.commit()
+
+        if roles_updated:
+            from app.services.market_cache import MarketAnalysisCache
+            MarketAnalysisCache().invalidate()
+
+        return {
+            "dataset_version": version,
+            "incremental": start > 0,
+            "rows_processed": table.num_rows - start,
+            "roles_updated": roles_updated
+        }
+
+    def _aggregate(self, table, start: int, version: str, db: Session) -> int:
+        aggregates: Dict[str, RoleAggregate] = {}
+        # Roles already written by this run are folded into, never replaced.
+        written = set()
+        names = table.column_names
+
+        for batch in table.slice(start).to_batches(max_chunksize=BATCH_ROWS):
+            titles = batch.column(names.index("title")).to_pylist()
+            skills = (
+                batch.column(names.index("skills")).to_pylist()
+                if "skills" in names else [None] * len(titles)
+            )
+            descriptions = (
+                batch.column(names.index("description")).to_pylist()
+                if "description" in names else [None] * len(titles)
+            )
+
+            for title, skills_str, description in zip(titles, skills, descriptions):
+                if not title:
+                    continue
+                key = role_cluster_key(title)
+                if not key:
+                    continue
+                if key not in aggregates:
+                    aggregates[key] = RoleAggregate(title)
+                aggregates[key].add(parse_skills(skills_str), description)
+
+            if len(aggregates) > MAX_ROLES_IN_MEMORY:
+                self._persist(aggregates, version, db, start > 0, written)
+                aggregates = {}
+
+        self._persist(aggregates, version, db, start > 0, written)
+
+        if start == 0:
+            db.query(MarketProfile).filter(
+                MarketProfile.dataset_version != version
+            ).delete(synchronize_session=False)
+            db.commit()
+
+        return len(written)
+
+    def _persist(
+        self,
+        aggregates: Dict[str, RoleAggregate],
+        version: str,
+        db: Session,
+        fold: bool,
+        written: set
+    ) -> None:
+        market_agent = registry.get_market_agent()
+        keys = list(aggregates)
+
+        for i in range(0, len(keys), PERSIST_BATCH):
+            batch_keys = keys[i:i + PERSIST_BATCH]
+            existing = {
+                p.role_key: p for p in db.query(MarketProfile).filter(
+                    MarketProfile.role_key.in_(batch_keys)
+                ).all()
+            }
+
+            for key in batch_keys:
+                aggregate = aggregates[key]
+                profile = existing.get(key)
+
+                total_jobs = aggregate.total_jobs
+                skill_counts = aggregate.skill_counts
+                samples = aggregate.sample_descriptions
+                if profile and (fold or key in written):
+                    total_jobs += profile.total_jobs
+                    skill_counts = Counter(profile.skill_counts) + skill_counts
+                    samples = (profile.sample_descriptions + samples)[:SAMPLE_DESCRIPTIONS]
+
+                market_skills = []
+                if total_jobs >= MIN_PROFILE_JOBS:
+                    market_skills = market_agent.build_market_skills(
+                        skill_counts, total_jobs, samples
+                    )
+
+                if profile is None:
+                    profile = MarketProfile(role_key=key)
+                    db.add(profile)
+                profile.role_title = profile.role_title or aggregate.role_title
+                profile.total_jobs = total_jobs
+                profile.skill_counts = dict(skill_counts)
+                profile.sample_descriptions = samples
+                profile.market_skills = market_skills
+                profile.dataset_version = version
+                written.add(key)
+
+            db.commit()
+
+def load_market_profile(role: str, db: Session) -> Optional[Dict]:
+    profile = db.query(MarketProfile).filter(
+        MarketProfile.role_key == role_cluster_key(role)
+    ).first()
+
+    if not profile or not profile.market_skills:
+        return None
+
+    return {
+        "role": role,
+        "market_skills": profile.market_skills,
+        "total_jobs_analyzed": profile.total_jobs
+    }
+
+if __name__ == "__main__":
+    from app.db.session import SessionLocal
+
+    parser = argparse.ArgumentParser(description="Precompute per-role market profiles")
+    parser.add_argument("--full", action="store_true", help="rebuild from the first posting")
+    args = parser.parse_args()
+
+    db = SessionLocal()
+    try:
+        print(MarketProfileBuilder().run(db, incremental=not args.full))
+    finally:
+        db.close()
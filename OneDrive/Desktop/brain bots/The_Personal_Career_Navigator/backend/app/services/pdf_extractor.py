@@ -0,0 +1,155 @@
+# backend/app/services/pdf_extractor.py
+import multiprocessing
+import sys
+import threading
+import warnings
+from typing import Callable, Dict, Iterable, Iterator, List
+from app.core.config import settings
+from app.services.skill_matcher import get_skill_matcher
+
+try:
+    import resource
+except ImportError:
+    resource = None
+
+try:
+    import billiard
+except ImportError:
+    billiard = None
+
+# Characters of the previous page matched again with the next one, so
+# skills broken across a page boundary are still found.
+PAGE_OVERLAP_CHARS = 64
+
+_context = multiprocessing.get_context(
+    "forkserver" if "forkserver" in multiprocessing.get_all_start_methods() else "spawn"
+)
+if _context.get_start_method() == "forkserver":
+    # Import the parser once in the fork server instead of in every child.
+    # Children also re-run a main module started with -m (e.g. the profile
+    # backfill), which the server does not preload itself.
+    _preload = ["app.services.pdf_extractor", "PyPDF2"]
+    _main_name = getattr(getattr(sys.modules["__main__"], "__spec__", None), "name", "")
+    if _main_name and not _main_name.endswith("__main__"):
+        _preload.append(_main_name)
+    _context.set_forkserver_preload(_preload)
+    # Re-running that already imported module makes runpy warn in each child.
+    warnings.filterwarnings(
+        "ignore", message=".*found in sys.modules after import of package", category=RuntimeWarning
+    )
+
+_slots = threading.BoundedSemaphore(settings.PDF_WORKERS)
+
+class PdfExtractionError(Exception):
+    pass
+
+def extract_pdf_skills(path: str) -> List[str]:
+    """Match skills in a PDF inside a separate, resource-limited process.
+    
+    At most PDF_WORKERS documents are parsed at once. A document is
+    rejected when it has more than PDF_MAX_PAGES pages, and its process
+    is killed after PDF_TIMEOUT seconds or when it goes over
+    PDF_MAX_MEMORY_MB.
+    """
+    return _run_limited(_match_pages, path)
+
+def extract_pdf_pages(path: str) -> List[str]:
+    # Page texts, read under the same process, time and memory limits.
+    return _run_limited(_read_pages, path)
+
+def _run_limited(fn: Callable[[str, int], List[str]], path: str) -> List[str]:
+    if not _slots.acquire(timeout=settings.PDF_TIMEOUT):
+        raise PdfExtractionError("No PDF worker available")
+    
+    try:
+        receiver, sender = _context.Pipe(duplex=False)
+        args = (fn, path, settings.PDF_MAX_PAGES, settings.PDF_MAX_MEMORY_MB, sender)
+        try:
+            process = _start_child(_context, args)
+        except AssertionError:
+            # Daemonic parents (e.g. Celery prefork workers) cannot start
+            # multiprocessing children, but billiard's processes can.
+            if billiard is None:
+                receiver.close()
+                sender.close()
+                raise PdfExtractionError("Cannot start a PDF worker from a daemonic process")
+            process = _start_child(billiard, args)
+        
+        sender.close()
+        try:
+            if not receiver.poll(settings.PDF_TIMEOUT):
+                raise PdfExtractionError(f"Timed out after {settings.PDF_TIMEOUT}s")
+            status, payload = receiver.recv()
+        except EOFError:
+            process.join(1.0)
+            raise PdfExtractionError(f"PDF worker exited with code {process.exitcode}")
+        finally:
+            if process.is_alive():
+                # billiard processes have no kill().
+                getattr(process, "kill", process.terminate)()
+            process.join()
+            receiver.close()
+    
+    finally:
+        _slots.release()
+    
+    if status != "ok":
+        raise PdfExtractionError(payload)
+    return payload
+
+def _start_child(context, args: tuple):
+    process = context.Process(target=_extract_in_child, args=args, daemon=True)
+    process.start()
+    return process
+
+def _extract_in_child(
+    fn: Callable[[str, int], List[str]], path: str, max_pages: int, max_memory_mb: int, sender
+) -> None:
+    try:
+        if resource is not None and max_memory_mb:
+            limit = max_memory_mb * 1024 * 1024
+            resource.setrlimit(resource.RLIMIT_AS, (limit, limit))
+        sender.send(("ok", fn(path, max_pages)))
+    except BaseException as e:
+        sender.send(("error", f"{type(e).__name__}: {e}"))
+    finally:
+        sender.close()
+
+def iter_page_texts(path: str, max_pages: int) -> Iterator[str]:
+    import PyPDF2
+    
+    with open(path, "rb") as file:
+        reader = PyPDF2.PdfReader(file)
+        if len(reader.pages) > max_pages:
+            raise PdfExtractionError(f"PDF has {len(reader.pages)} pages, limit is {max_pages}")
+        
+        for page in reader.pages:
+            yield page.extract_text() or ""
+
+def page_windows(pages: Iterable[str]) -> Iterator[str]:
+    """Each page's text prefixed with the tail of the page before it."""
+    overlap = ""
+    for text in pages:
+        yield overlap + text
+        overlap = _tail(text)
+
+def _read_pages(path: str, max_pages: int) -> List[str]:
+    return list(iter_page_texts(path, max_pages))
+
+def _match_pages(path: str, max_pages: int) -> List[str]:
+    matcher = get_skill_matcher()
+    found: Dict[str, None] = {}
+    
+    for window in page_windows(iter_page_texts(path, max_pages)):
+        for skill in matcher.find(window):
+            found.setdefault(skill, None)
+    
+    return list(found)
+
+def _tail(text: str) -> str:
+    tail = text[-PAGE_OVERLAP_CHARS:]
+    if len(text) > PAGE_OVERLAP_CHARS:
+        # Start on a word boundary so a cut-off word cannot match.
+        space = tail.find(" ")
+        tail = tail[space + 1:] if space >= 0 else ""
+    return tail + "\n"
@@ -0,0 +1,140 @@
+# backend/app/services/pipeline_graph.py
+import hashlib
+import json
+from datetime import datetime
+from typing import Any, Callable, Dict, List, Optional, Tuple
+from sqlalchemy.orm import Session
+from app.models.pipeline_stage import PipelineStageResult
+from app.services.skill_store import UPSERT_DIALECTS
+
+# Bump when stage logic changes so stored outputs are recomputed.
+PIPELINE_VERSION = 1
+
+def fingerprint(*parts) -> str:
+    payload = json.dumps(parts, sort_keys=True, default=str)
+    return hashlib.sha256(payload.encode()).hexdigest()
+
+class PipelineStage:
+    def __init__(
+        self,
+        name: str,
+        inputs: List[str],
+        compute: Callable[[Dict[str, Any], Any], Dict],
+        key: Callable[[], Optional[str]] = None,
+        start: Callable[[], Any] = None,
+        keep: Callable[[Dict], bool] = None
+    ):
+        self.name = name
+        self.inputs = inputs
+        self.compute = compute
+        self.key = key
+        self.start = start
+        self.keep = keep
+
+class StageGraph:
+    """Pipeline stages run in dependency order with stored outputs.
+    
+    A stage's fingerprint hashes its own external inputs (key) together
+    with the fingerprints of the stages it reads, so every fingerprint is
+    known before anything runs. Stages whose fingerprint matches the stored
+    one reuse the stored output; the rest are recomputed and stored. A key
+    of None, or an output that keep rejects, is never stored, and neither
+    is anything downstream of it. Stale stages without inputs are started
+    up front so they overlap with the rest of the run.
+    """
+    
+    def __init__(self, stages: List[PipelineStage]):
+        self.stages = stages
+    
+    def fingerprints(self) -> Dict[str, Optional[str]]:
+        fingerprints = {}
+        for stage in self.stages:
+            own = stage.key() if stage.key else ""
+            upstream = [fingerprints[name] for name in stage.inputs]
+            if own is None or None in upstream:
+                fingerprints[stage.name] = None
+            else:
+                fingerprints[stage.name] = fingerprint(PIPELINE_VERSION, stage.name, own, upstream)
+        return fingerprints
+    
+    def run(
+        self,
+        db: Session,
+        user_id: int,
+        on_stage: Callable[[str, Dict, bool], None] = None
+    ) -> Tuple[Dict[str, Dict], List[str]]:
+        fingerprints = self.fingerprints()
+        stored = {
+            row.stage: row
+            for row in db.query(PipelineStageResult).filter(PipelineStageResult.user_id == user_id)
+        }
+        fresh = set()
+        for stage in self.stages:
+            row = stored.get(stage.name)
+            if (
+                row is not None
+                and row.fingerprint == fingerprints[stage.name]
+                and fresh.issuperset(stage.inputs)
+            ):
+                fresh.add(stage.name)
+        
+        started = {
+            stage.name: stage.start()
+            for stage in self.stages
+            if stage.start and not stage.inputs and stage.name not in fresh
+        }
+        
+        outputs, reused, unsettled = {}, [], set()
+        for stage in self.stages:
+            if stage.name in fresh:
+                outputs[stage.name] = stored[stage.name].output
+                reused.append(stage.name)
+            else:
+                output = stage.compute(outputs, started.get(stage.name))
+                outputs[stage.name] = output
+                
+                if (
+                    fingerprints[stage.name] is None
+                    or (stage.keep and not stage.keep(output))
+                    or unsettled.intersection(stage.inputs)
+                ):
+                    unsettled.add(stage.name)
+                else:
+                    save_stage_result(db, user_id, stage.name, fingerprints[stage.name], output)
+            
+            if on_stage:
+                on_stage(stage.name, outputs[stage.name], stage.name in fresh)
+        
+        return outputs, reused
+
+def save_stage_result(db: Session, user_id: int, stage: str, fp: str, output: Dict) -> None:
+    row = {
+        "user_id": user_id,
+        "stage": stage,
+        "fingerprint": fp,
+        "output": output,
+        "updated_at": datetime.utcnow()
+    }
+    
+    insert = UPSERT_DIALECTS.get(db.get_bind().dialect.name)
+    if insert is None:
+        existing = db.query(PipelineStageResult).filter(
+            PipelineStageResult.user_id == user_id, PipelineStageResult.stage == stage
+        ).first()
+        if existing:
+            existing.fingerprint = fp
+            existing.output = output
+        else:
+            db.add(PipelineStageResult(**row))
+        return
+    
+    stmt = insert(PipelineStageResult).values(row)
+    stmt = stmt.on_conflict_do_update(
+        index_elements=[PipelineStageResult.user_id, PipelineStageResult.stage],
+        set_={
+            "fingerprint": stmt.excluded.fingerprint,
+            "output": stmt.excluded.output,
+            "updated_at": stmt.excluded.updated_at
+        }
+    )
+    db.execute(stmt)
@@ -0,0 +1,186 @@
+# backend/app/services/profile_backfill.py
+import argparse
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, Iterator, List, Optional, Tuple
+import spacy
+from spacy.language import Language
+from spacy.tokens import Doc
+from sqlalchemy import or_
+from sqlalchemy.orm import Session
+from app.core.registry import SPACY_MODEL_NAME
+from app.db.session import SessionLocal
+# Registers the mappers User's relationships refer to.
+from app.models import evaluation, roadmap, skill  # noqa: F401
+from app.models.user import User
+from app.agents.profile_extraction import resume_skill_entries
+from app.services.linkedin_service import experience_skill_entries, first_profile_entries, listed_skill_entry
+from app.services.pdf_extractor import extract_pdf_pages, page_windows
+from app.services.skill_matcher import get_skill_matcher
+from app.services.upload_store import UploadStore
+
+USER_BATCH = 1000
+PROGRESS_EVERY = 1000
+# Trained components skill matching does not use; only the tokenizer runs.
+DISABLED_COMPONENTS = ["tok2vec", "tagger", "parser", "attribute_ruler", "lemmatizer", "ner", "senter"]
+
+if not Doc.has_extension("skills"):
+    Doc.set_extension("skills", default=None)
+
+@Language.component("skill_matcher")
+def match_skills(doc: Doc) -> Doc:
+    doc._.skills = get_skill_matcher().find(doc.text)
+    return doc
+
+def build_nlp() -> Language:
+    try:
+        nlp = spacy.load(SPACY_MODEL_NAME, exclude=DISABLED_COMPONENTS)
+    except OSError:
+        nlp = spacy.blank("en")
+    nlp.add_pipe("skill_matcher")
+    return nlp
+
+def load_upload(job: Tuple[str, str]) -> Optional[Tuple]:
+    kind, path = job
+    try:
+        digest = UploadStore().digest_of(path)
+        
+        if kind == "resume":
+            # Parsed in a limited child process, like live extraction.
+            pages = extract_pdf_pages(path)
+            return kind, digest, [], [(window, None) for window in page_windows(pages)]
+        
+        listed, experiences = [], []
+        for entry_kind, entry in first_profile_entries(path):
+            if entry_kind == "skill":
+                listed.append(listed_skill_entry(entry))
+            else:
+                experiences.append((
+                    entry.get("description", ""),
+                    {"company": entry.get("company", ""), "title": entry.get("title", "")}
+                ))
+        return kind, digest, listed, experiences
+    
+    except Exception as e:
+        print(f"Error loading {path}: {e}")
+        return None
+
+class ProfileBackfill:
+    """Re-extract skills from every stored resume and LinkedIn export.
+    
+    Uploads are read in a process pool and their text is matched through
+    spaCy's nlp.pipe, batched and spread over n_process workers. PDFs are
+    read under the live extractor's limits and matched page by page with
+    the same overlap, so results equal what extraction would give. Results
+    overwrite the upload store's extraction cache, which the pipeline
+    reads on its next run.
+    """
+    
+    def __init__(self, batch_size: int = 256, n_process: int = 1, load_workers: int = None):
+        self.batch_size = batch_size
+        self.n_process = n_process
+        self.load_workers = load_workers or os.cpu_count()
+        self.store = UploadStore()
+    
+    def run(self, db: Session) -> Dict:
+        stats = {"users": 0, "documents": 0, "texts": 0, "failed": 0}
+        started_at = time.monotonic()
+        
+        nlp = build_nlp()
+        skills: List[Dict] = []
+        found: Dict[str, None] = {}
+        pending: Dict[Tuple[str, str], List[Dict]] = {}
+        
+        for doc, (kind, digest, entries, evidence, last) in nlp.pipe(
+            self._texts(db, stats),
+            as_tuples=True,
+            batch_size=self.batch_size,
+            n_process=self.n_process
+        ):
+            stats["texts"] += 1
+            skills.extend(entries)
+            if kind == "resume":
+                for name in doc._.skills:
+                    found.setdefault(name, None)
+            elif evidence is not None:
+                skills.extend(experience_skill_entries(evidence, doc._.skills))
+            
+            if last:
+                skills.extend(resume_skill_entries(list(found)))
+                pending[(kind, digest)] = skills
+                skills, found = [], {}
+                stats["documents"] += 1
+                if stats["documents"] % PROGRESS_EVERY == 0:
+                    self._flush(pending)
+                    print(self._report(stats, started_at))
+        
+        self._flush(pending)
+        return self._report(stats, started_at)
+    
+    def _texts(self, db: Session, stats: Dict) -> Iterator[Tuple[str, Tuple]]:
+        seen = set()
+        
+        with ProcessPoolExecutor(max_workers=self.load_workers) as pool:
+            for jobs in self._job_batches(db, stats):
+                jobs = [job for job in jobs if job not in seen]
+                seen.update(jobs)
+                
+                for loaded in pool.map(load_upload, jobs, chunksize=16):
+                    if loaded is None:
+                        stats["failed"] += 1
+                        continue
+                    
+                    kind, digest, listed, texts = loaded
+                    # An export without experience still needs one doc to close it.
+                    texts = texts or [("", None)]
+                    for i, (text, evidence) in enumerate(texts):
+                        yield text, (kind, digest, listed if i == 0 else [], evidence, i == len(texts) - 1)
+    
+    def _job_batches(self, db: Session, stats: Dict) -> Iterator[List[Tuple[str, str]]]:
+        last_id = 0
+        
+        while True:
+            users = db.query(User.id, User.resume_path, User.linkedin_data_path).filter(
+                User.id > last_id,
+                or_(User.resume_path.isnot(None), User.linkedin_data_path.isnot(None))
+            ).order_by(User.id).limit(USER_BATCH).all()
+            if not users:
+                return
+            
+            stats["users"] += len(users)
+            last_id = users[-1].id
+            
+            jobs = []
+            for user in users:
+                if user.resume_path:
+                    jobs.append(("resume", user.resume_path))
+                if user.linkedin_data_path:
+                    jobs.append(("linkedin", user.linkedin_data_path))
+            yield jobs
+    
+    def _flush(self, pending: Dict[Tuple[str, str], List[Dict]]) -> None:
+        for (kind, digest), skills in pending.items():
+            self.store.cache_skills(kind, digest, skills)
+        pending.clear()
+    
+    def _report(self, stats: Dict, started_at: float) -> Dict:
+        seconds = time.monotonic() - started_at
+        return {
+            **stats,
+            "seconds": round(seconds, 2),
+            "documents_per_second": round(stats["documents"] / seconds, 1) if seconds else None
+        }
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Re-extract skills from all stored uploads")
+    parser.add_argument("--batch-size", type=int, default=256, help="texts per nlp.pipe batch")
+    parser.add_argument("--n-process", type=int, default=1, help="spaCy worker processes")
+    parser.add_argument("--load-workers", type=int, default=None, help="processes reading uploads")
+    args = parser.parse_args()
+    
+    db = SessionLocal()
+    try:
+        print(ProfileBackfill(args.batch_size, args.n_process, args.load_workers).run(db))
+    finally:
+        db.close()
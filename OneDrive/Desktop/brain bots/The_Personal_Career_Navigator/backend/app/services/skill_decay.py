@@ -0,0 +1,31 @@
+# backend/app/services/skill_decay.py
+from datetime import datetime
+from typing import List, Optional
+import numpy as np
+
+WEEKLY_DECAY = 0.98
+SECONDS_PER_WEEK = 7 * 24 * 3600
+
+# Stored skill levels are exact at their anchor time and fade by
+# WEEKLY_DECAY per week after it, so they are decayed when read instead
+# of being rewritten by the weekly job.
+
+def anchor_of(skill) -> Optional[datetime]:
+    return skill.level_anchor_at or skill.updated_at
+
+def decayed_level(level: float, anchor_at: Optional[datetime], now: datetime = None) -> float:
+    if not level or anchor_at is None:
+        return level or 0.0
+    
+    elapsed = ((now or datetime.utcnow()) - anchor_at).total_seconds()
+    return level * WEEKLY_DECAY ** (max(elapsed, 0.0) / SECONDS_PER_WEEK)
+
+def decayed_levels(
+    levels: np.ndarray, anchors: List[Optional[datetime]], now: datetime = None
+) -> np.ndarray:
+    now = now or datetime.utcnow()
+    elapsed = np.array([
+        (now - anchor).total_seconds() if anchor is not None else 0.0 for anchor in anchors
+    ], dtype=np.float64)
+    
+    return levels * np.power(WEEKLY_DECAY, np.maximum(elapsed, 0.0) / SECONDS_PER_WEEK)
@@ -0,0 +1,170 @@
+# backend/app/services/skill_matcher.py
+import hashlib
+import json
+import threading
+from collections import deque
+from typing import Dict, List, Optional
+from app.core.config import settings
+
+SKILL_TAXONOMY = {
+    "Python": [],
+    "JavaScript": ["js"],
+    "TypeScript": ["ts"],
+    "Java": [],
+    "C++": ["cpp"],
+    "C#": ["csharp"],
+    "Ruby": [],
+    "Go": ["golang"],
+    "Rust": [],
+    "R": [],
+    "React": ["react.js", "reactjs"],
+    "Angular": ["angularjs"],
+    "Vue.js": ["vue", "vuejs"],
+    "Node.js": ["nodejs"],
+    "Django": [],
+    "Flask": [],
+    "FastAPI": [],
+    "Docker": [],
+    "Kubernetes": ["k8s"],
+    "Jenkins": [],
+    "CI/CD": ["continuous integration"],
+    "Git": [],
+    "AWS": ["amazon web services"],
+    "Azure": [],
+    "GCP": ["google cloud"],
+    "Cloud": [],
+    "SQL": [],
+    "PostgreSQL": ["postgres"],
+    "MySQL": [],
+    "MongoDB": ["mongo"],
+    "Redis": [],
+    "Spark": ["pyspark", "apache spark"],
+    "Pandas": [],
+    "MLOps": [],
+    "Machine Learning": ["ml"],
+    "Deep Learning": [],
+    "NLP": ["natural language processing"],
+    "Computer Vision": [],
+    "TensorFlow": [],
+    "PyTorch": [],
+    "Scikit-learn": ["sklearn", "scikit learn"],
+    "Data Science": [],
+    "Analytics": [],
+    "Statistics": [],
+    "Agile": [],
+    "Scrum": [],
+    "Leadership": [],
+    "Project Management": [],
+}
+
+# Short names that are also common words only count with their exact casing.
+CASE_SENSITIVE_PATTERNS = {"Go", "R"}
+# Characters that glue a one-character name into a larger token, as in
+# "R&D" or "R-squared", on top of ordinary word characters.
+SHORT_NAME_JOINERS = {"&", "-"}
+
+_matcher: Optional["SkillMatcher"] = None
+_matcher_lock = threading.Lock()
+
+def _is_word_char(ch: str) -> bool:
+    return ch.isalnum() or ch == "_"
+
+def _joins(ch: str, pattern: str) -> bool:
+    return _is_word_char(ch) or (len(pattern) == 1 and ch in SHORT_NAME_JOINERS)
+
+class SkillMatcher:
+    """Aho-Corasick automaton over skill names and their aliases.
+
+    Text is scanned once, case-insensitively, and every hit is mapped to
+    its canonical skill. A hit only counts when it is not glued to
+    surrounding word characters, so "Go" does not match inside "good".
+    One-character names must not touch "&" or "-" either, so "R&D" is
+    not R.
+    """
+
+    def __init__(self, taxonomy: Dict[str, List[str]]):
+        payload = json.dumps(taxonomy, sort_keys=True)
+        self.version = hashlib.sha256(payload.encode()).hexdigest()[:16]
+        self._goto: List[Dict[str, int]] = [{}]
+        self._fail: List[int] = [0]
+        self._out: List[List[tuple]] = [[]]
+
+        for canonical, aliases in taxonomy.items():
+            for pattern in [canonical, *aliases]:
+                self._add(pattern, canonical)
+        self._link()
+
+    def find(self, text: str) -> List[str]:
+        found = {}
+        node = 0
+
+        for i, ch in enumerate(text):
+            lowered = ch.lower()
+            if len(lowered) != 1:
+                lowered = ch
+
+            while node and lowered not in self._goto[node]:
+                node = self._fail[node]
+            node = self._goto[node].get(lowered, 0)
+
+            for length, canonical, pattern in self._out[node]:
+                start = i - length + 1
+                if _is_word_char(pattern[0]) and start > 0 and _joins(text[start - 1], pattern):
+                    continue
+                if _is_word_char(pattern[-1]) and i + 1 < len(text) and _joins(text[i + 1], pattern):
+                    continue
+                if pattern in CASE_SENSITIVE_PATTERNS and text[start:i + 1] != pattern:
+                    continue
+                found.setdefault(canonical, None)
+
+        return list(found)
+
+    def _add(self, pattern: str, canonical: str) -> None:
+        node = 0
+        for ch in pattern.lower():
+            nxt = self._goto[node].get(ch)
+            if nxt is None:
+                nxt = len(self._goto)
+                self._goto[node][ch] = nxt
+                self._goto.append({})
+                self._fail.append(0)
+                self._out.append([])
+            node = nxt
+        self._out[node].append((len(pattern), canonical, pattern))
+
+    def _link(self) -> None:
+        queue = deque(self._goto[0].values())
+        while queue:
+            node = queue.popleft()
+            for ch, child in self._goto[node].items():
+                queue.append(child)
+                fail = self._fail[node]
+                while fail and ch not in self._goto[fail]:
+                    fail = self._fail[fail]
+                self._fail[child] = self._goto[fail].get(ch, 0)
+                self._out[child].extend(self._out[self._fail[child]])
+
+def load_taxonomy() -> Dict[str, List[str]]:
+    taxonomy = {skill: list(aliases) for skill, aliases in SKILL_TAXONOMY.items()}
+
+    if settings.SKILL_TAXONOMY_PATH:
+        try:
+            with open(settings.SKILL_TAXONOMY_PATH, "r") as f:
+                for skill, aliases in json.load(f).items():
+                    taxonomy.setdefault(skill, []).extend(aliases)
+        except Exception as e:
+            print(f"Error loading skill taxonomy: {e}")
+
+    return taxonomy
+
+def get_skill_matcher() -> SkillMatcher:
+    global _matcher
+    if _matcher is None:
+        with _matcher_lock:
+            if _matcher is None:
+                _matcher = SkillMatcher(load_taxonomy())
+    return _matcher
+
+def taxonomy_version() -> str:
+    # Hash of the taxonomy the matcher was built from; changes with it.
+    return get_skill_matcher().version
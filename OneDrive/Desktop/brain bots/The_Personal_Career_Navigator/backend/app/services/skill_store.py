@@ -0,0 +1,93 @@
+# backend/app/services/skill_store.py
+from datetime import datetime
+from typing import Dict, List
+from sqlalchemy import inspect
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.orm import Session
+from app.models.skill import Skill
+from app.schemas.skill import SkillGap
+
+UPSERT_DIALECTS = {
+    "postgresql": postgresql.insert,
+    "sqlite": sqlite.insert
+}
+CONFLICT_COLUMNS = {"user_id", "skill_name"}
+
+_conflict_targets: Dict[str, bool] = {}
+
+def upsert_skill_gaps(
+    db: Session, user_id: int, gaps: List[SkillGap], user_skills: Dict[str, Dict]
+) -> int:
+    """Write a user's gap scores with one INSERT ... ON CONFLICT statement.
+    
+    New skills are inserted with their evidence; skills the user already
+    has only get their level, importance and gap score refreshed.
+    """
+    now = datetime.utcnow()
+    rows = {}
+    for gap in gaps:
+        rows[gap.skill] = {
+            "user_id": user_id,
+            "skill_name": gap.skill,
+            "user_level": gap.user_level,
+            "importance": gap.importance,
+            "gap_score": gap.gap_score,
+            "evidence": user_skills.get(gap.skill, {}).get("evidence", []),
+            "level_anchor_at": now,
+            "created_at": now,
+            "updated_at": now
+        }
+    if not rows:
+        return 0
+    
+    insert = UPSERT_DIALECTS.get(db.get_bind().dialect.name)
+    if insert is None or not _has_conflict_target(db):
+        return _upsert_skill_gaps_orm(db, user_id, list(rows.values()))
+    
+    stmt = insert(Skill).values(list(rows.values()))
+    stmt = stmt.on_conflict_do_update(
+        index_elements=[Skill.user_id, Skill.skill_name],
+        set_={
+            "user_level": stmt.excluded.user_level,
+            "importance": stmt.excluded.importance,
+            "gap_score": stmt.excluded.gap_score,
+            "level_anchor_at": stmt.excluded.level_anchor_at,
+            "updated_at": stmt.excluded.updated_at
+        }
+    )
+    db.execute(stmt)
+    return len(rows)
+
+def _has_conflict_target(db: Session) -> bool:
+    # ON CONFLICT needs uq_skills_user_skill, added by alembic upgrade head.
+    # Checked once per database; restart after migrating to switch over.
+    url = str(db.get_bind().url)
+    if url not in _conflict_targets:
+        inspector = inspect(db.connection())
+        keys = [c["column_names"] for c in inspector.get_unique_constraints(Skill.__tablename__)]
+        keys += [i["column_names"] for i in inspector.get_indexes(Skill.__tablename__) if i["unique"]]
+        _conflict_targets[url] = any(set(key) == CONFLICT_COLUMNS for key in keys)
+        if not _conflict_targets[url]:
+            print("Skill upsert unavailable until alembic upgrade head, using ORM writes")
+    return _conflict_targets[url]
+
+def _upsert_skill_gaps_orm(db: Session, user_id: int, rows: List[Dict]) -> int:
+    existing = {
+        skill.skill_name: skill
+        for skill in db.query(Skill).filter(
+            Skill.user_id == user_id,
+            Skill.skill_name.in_([row["skill_name"] for row in rows])
+        )
+    }
+    
+    for row in rows:
+        skill = existing.get(row["skill_name"])
+        if skill:
+            skill.user_level = row["user_level"]
+            skill.importance = row["importance"]
+            skill.gap_score = row["gap_score"]
+            skill.level_anchor_at = row["level_anchor_at"]
+        else:
+            db.add(Skill(**row))
+    
+    return len(rows)
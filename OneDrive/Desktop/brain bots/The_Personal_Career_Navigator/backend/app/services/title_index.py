@@ -0,0 +1,278 @@
+# backend/app/services/title_index.py
+import os
+import re
+import threading
+from collections import defaultdict
+from typing import Dict, List, Optional
+import numpy as np
+import pyarrow as pa
+
+try:
+    import fcntl
+except ImportError:
+    fcntl = None
+
+ROLE_ALIASES = {
+    "ml": "machine learning",
+    "ai": "artificial intelligence",
+    "ds": "data scientist",
+    "swe": "software engineer",
+    "sde": "software development engineer",
+    "sre": "site reliability engineer",
+    "qa": "quality assurance",
+    "ux": "user experience",
+    "ui": "user interface",
+    "pm": "product manager",
+    "eng": "engineer",
+    "engr": "engineer",
+    "dev": "developer",
+    "devs": "developers",
+    "mgr": "manager",
+    "sr": "senior",
+    "jr": "junior",
+    "front-end": "frontend",
+    "back-end": "backend",
+    "fullstack": "full stack",
+    "full-stack": "full stack",
+}
+
+FUZZY_THRESHOLD = 0.5
+
+_TOKEN_RE = re.compile(r"[a-z0-9+#]+(?:-[a-z0-9+#]+)*")
+
+_indexes: Dict[str, "TitleIndex"] = {}
+_indexes_lock = threading.Lock()
+
+def normalize_title(title: str) -> List[str]:
+    tokens = []
+    for token in _TOKEN_RE.findall(title.lower()):
+        expansion = ROLE_ALIASES.get(token)
+        if expansion is None and "-" in token:
+            tokens.extend(token.split("-"))
+        elif expansion is None:
+            tokens.append(token)
+        else:
+            tokens.extend(expansion.split())
+    return tokens
+
+def _trigrams(token: str) -> set:
+    padded = f"  {token} "
+    return {padded[i:i + 3] for i in range(len(padded) - 2)}
+
+class TitleIndex:
+    """Token and trigram inverted index over posting titles.
+
+    Distinct titles are indexed once and map to their posting rows. Query
+    tokens are matched exactly or, through a trigram index over the token
+    vocabulary, to similar tokens ("engineer" ~ "engineering"). Titles are
+    ranked by how many query tokens they cover, then by token similarity,
+    then by how few extra tokens they carry.
+    """
+
+    def __init__(self, titles: pa.ChunkedArray):
+        encoded = titles.combine_chunks().dictionary_encode()
+        title_ids = encoded.indices.fill_null(-1).to_numpy(zero_copy_only=False)
+
+        valid = np.flatnonzero(title_ids >= 0)
+        order = valid[np.argsort(title_ids[valid], kind="stable")]
+        self.rows = order.astype(np.int64)
+        self.row_offsets = np.searchsorted(
+            title_ids[order], np.arange(len(encoded.dictionary) + 1)
+        )
+
+        token_ids: Dict[str, int] = {}
+        token_postings = defaultdict(list)
+        self.title_lengths = np.zeros(len(encoded.dictionary), dtype=np.int32)
+        for title_id, title in enumerate(encoded.dictionary.to_pylist()):
+            tokens = set(normalize_title(title))
+            self.title_lengths[title_id] = len(tokens)
+            for token in tokens:
+                token_id = token_ids.setdefault(token, len(token_ids))
+                token_postings[token_id].append(title_id)
+
+        self.token_ids = token_ids
+        self.vocabulary = list(token_ids)
+        self.token_postings = [
+            np.asarray(token_postings[i], dtype=np.int64) for i in range(len(token_ids))
+        ]
+
+        trigram_postings = defaultdict(list)
+        for token, token_id in token_ids.items():
+            for trigram in _trigrams(token):
+                trigram_postings[trigram].append(token_id)
+        self.trigram_postings = dict(trigram_postings)
+        self.trigram_counts = np.asarray(
+            [len(_trigrams(token)) for token in self.vocabulary], dtype=np.int32
+        )
+
+    def save(self, path: str, version: str) -> None:
+        token_flat, token_offsets = _flatten(self.token_postings)
+        trigrams = list(self.trigram_postings)
+        trigram_flat, trigram_offsets = _flatten([self.trigram_postings[t] for t in trigrams])
+
+        tmp_path = f"{path}.tmp.npz"
+        np.savez(
+            tmp_path,
+            version=np.array(version),
+            rows=self.rows,
+            row_offsets=self.row_offsets,
+            title_lengths=self.title_lengths,
+            vocabulary=np.array(self.vocabulary, dtype=str),
+            token_flat=token_flat,
+            token_offsets=token_offsets,
+            trigrams=np.array(trigrams, dtype=str),
+            trigram_flat=trigram_flat,
+            trigram_offsets=trigram_offsets,
+            trigram_counts=self.trigram_counts
+        )
+        os.replace(tmp_path, path)
+
+    @classmethod
+    def load(cls, path: str, version: str) -> Optional["TitleIndex"]:
+        try:
+            data = np.load(path)
+        except (OSError, ValueError):
+            return None
+
+        with data:
+            if str(data["version"]) != version:
+                return None
+
+            index = cls.__new__(cls)
+            index.rows = data["rows"]
+            index.row_offsets = data["row_offsets"]
+            index.title_lengths = data["title_lengths"]
+            index.vocabulary = data["vocabulary"].tolist()
+            index.token_ids = {token: i for i, token in enumerate(index.vocabulary)}
+            index.token_postings = _unflatten(data["token_flat"], data["token_offsets"])
+            index.trigram_postings = dict(zip(
+                data["trigrams"].tolist(),
+                (p.tolist() for p in _unflatten(data["trigram_flat"], data["trigram_offsets"]))
+            ))
+            index.trigram_counts = data["trigram_counts"]
+        return index
+
+    def search(self, role: str, limit: int = 100) -> np.ndarray:
+        query = list(dict.fromkeys(normalize_title(role)))
+        if not query:
+            return np.zeros(0, dtype=np.int64)
+
+        matched_ids, matched_scores = [], []
+        for token in query:
+            ids, scores = self._match_token(token)
+            matched_ids.append(ids)
+            matched_scores.append(scores)
+
+        all_ids = np.concatenate(matched_ids)
+        if not len(all_ids):
+            return np.zeros(0, dtype=np.int64)
+
+        title_ids, inverse = np.unique(all_ids, return_inverse=True)
+        coverage = np.bincount(inverse, minlength=len(title_ids))
+        similarity = np.bincount(
+            inverse, weights=np.concatenate(matched_scores), minlength=len(title_ids)
+        )
+
+        required = len(query) if coverage.max() == len(query) else (len(query) + 1) // 2
+        keep = coverage >= required
+        title_ids, coverage, similarity = title_ids[keep], coverage[keep], similarity[keep]
+
+        ranked = np.lexsort((
+            self.title_lengths[title_ids], -similarity, -coverage
+        ))
+
+        rows = []
+        remaining = limit
+        for title_id in title_ids[ranked]:
+            start, end = self.row_offsets[title_id], self.row_offsets[title_id + 1]
+            rows.append(self.rows[start:min(end, start + remaining)])
+            remaining -= len(rows[-1])
+            if remaining <= 0:
+                break
+
+        return np.concatenate(rows) if rows else np.zeros(0, dtype=np.int64)
+
+    def _match_token(self, token: str):
+        candidates = {}
+        if token in self.token_ids:
+            candidates[self.token_ids[token]] = 1.0
+
+        query_trigrams = _trigrams(token)
+        shared = defaultdict(int)
+        for trigram in query_trigrams:
+            for token_id in self.trigram_postings.get(trigram, ()):
+                shared[token_id] += 1
+
+        for token_id, count in shared.items():
+            if token_id in candidates:
+                continue
+            other = self.trigram_counts[token_id]
+            similarity = count / (len(query_trigrams) + other - count)
+            if similarity >= FUZZY_THRESHOLD:
+                candidates[token_id] = similarity
+
+        if not candidates:
+            return np.zeros(0, dtype=np.int64), np.zeros(0)
+
+        # Keep each title's best-matching token so coverage counts it once.
+        ids = np.concatenate([self.token_postings[t] for t in candidates])
+        scores = np.concatenate([
+            np.full(len(self.token_postings[t]), s) for t, s in candidates.items()
+        ])
+        order = np.lexsort((-scores, ids))
+        ids, scores = ids[order], scores[order]
+        first = np.ones(len(ids), dtype=bool)
+        first[1:] = ids[1:] != ids[:-1]
+        return ids[first], scores[first]
+
+def _flatten(postings: List) -> tuple:
+    offsets = np.zeros(len(postings) + 1, dtype=np.int64)
+    offsets[1:] = np.cumsum([len(p) for p in postings])
+    flat = np.concatenate(postings).astype(np.int64) if postings else np.zeros(0, dtype=np.int64)
+    return flat, offsets
+
+def _unflatten(flat: np.ndarray, offsets: np.ndarray) -> List[np.ndarray]:
+    return [flat[offsets[i]:offsets[i + 1]] for i in range(len(offsets) - 1)]
+
+def title_index_path(snapshot) -> str:
+    return f"{snapshot.snapshot_path}.titles.npz"
+
+def build_title_index(snapshot) -> TitleIndex:
+    """Load the title index saved next to the snapshot, building it if stale.
+
+    The index file records the snapshot version it was built from. Builds
+    are serialized with a file lock, so concurrent workers wait for one
+    build instead of each indexing every title.
+    """
+    version = snapshot.version()
+    path = title_index_path(snapshot)
+
+    index = TitleIndex.load(path, version)
+    if index is not None:
+        return index
+
+    with open(f"{path}.lock", "a") as lock_file:
+        if fcntl:
+            fcntl.flock(lock_file, fcntl.LOCK_EX)
+        try:
+            index = TitleIndex.load(path, version)
+            if index is None:
+                index = TitleIndex(snapshot.load()["title"])
+                index.save(path, version)
+            return index
+        finally:
+            if fcntl:
+                fcntl.flock(lock_file, fcntl.LOCK_UN)
+
+def get_title_index(snapshot) -> TitleIndex:
+    version = snapshot.version()
+    index = _indexes.get(version)
+    if index is not None:
+        return index
+
+    with _indexes_lock:
+        if version not in _indexes:
+            index = build_title_index(snapshot)
+            _indexes.clear()
+            _indexes[version] = index
+        return _indexes[version]
@@ -0,0 +1,169 @@
+# backend/app/services/upload_store.py
+import hashlib
+import json
+import os
+import re
+import uuid
+from contextlib import contextmanager
+from typing import Callable, Dict, Iterator, List, NamedTuple, Optional
+from fastapi import UploadFile
+from starlette.concurrency import run_in_threadpool
+from app.core.config import settings
+from app.services.skill_matcher import taxonomy_version
+
+try:
+    import fcntl
+except ImportError:
+    fcntl = None
+
+CHUNK_BYTES = 1024 * 1024
+# Bump when extraction logic changes so cached results are recomputed.
+EXTRACTION_VERSION = 4
+
+def extraction_version() -> str:
+    """EXTRACTION_VERSION with the skill taxonomy's hash folded in.
+    
+    Cached extractions and stored profiles keyed by it are recomputed when
+    either the extraction code or the taxonomy changes.
+    """
+    return f"{EXTRACTION_VERSION}.{taxonomy_version()}"
+
+_DIGEST = re.compile(r"^[0-9a-f]{64}$")
+
+class UploadTooLarge(ValueError):
+    pass
+
+class StoredUpload(NamedTuple):
+    digest: str
+    path: str
+    size: int
+    created: bool
+
+class UploadStore:
+    """Content-addressed upload files and their cached skill extractions.
+    
+    Uploads are stored as <root>/<kind>/<aa>/<sha256><ext>, so the same
+    file uploaded twice is kept once. Extraction results are cached per
+    content hash and kind, and a file lock makes concurrent extractions of
+    the same file wait for the first one instead of parsing it again.
+    """
+    
+    def __init__(self, root: str = None):
+        self.root = root or settings.UPLOAD_DIR
+        self.extractions_dir = os.path.join(self.root, "extractions")
+    
+    async def save(self, upload: UploadFile, kind: str, max_bytes: int) -> StoredUpload:
+        tmp_dir = os.path.join(self.root, "tmp")
+        os.makedirs(tmp_dir, exist_ok=True)
+        tmp_path = os.path.join(tmp_dir, uuid.uuid4().hex)
+        
+        digest = hashlib.sha256()
+        size = 0
+        try:
+            with open(tmp_path, "wb") as f:
+                while True:
+                    chunk = await upload.read(CHUNK_BYTES)
+                    if not chunk:
+                        break
+                    size += len(chunk)
+                    if size > max_bytes:
+                        raise UploadTooLarge(f"Upload exceeds {max_bytes} bytes")
+                    digest.update(chunk)
+                    await run_in_threadpool(f.write, chunk)
+            
+            hexdigest = digest.hexdigest()
+            ext = os.path.splitext(upload.filename or "")[1].lower()
+            path = os.path.join(self.root, kind, hexdigest[:2], f"{hexdigest}{ext}")
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            created = not os.path.exists(path)
+            if created:
+                os.replace(tmp_path, path)
+            else:
+                os.remove(tmp_path)
+        except BaseException:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
+        
+        return StoredUpload(hexdigest, path, size, created)
+    
+    def discard(self, stored: StoredUpload) -> None:
+        # Only a file this upload created is removed; an existing one may
+        # belong to another user.
+        if stored.created:
+            try:
+                os.remove(stored.path)
+            except OSError:
+                pass
+    
+    def digest_of(self, path: str) -> str:
+        name = os.path.splitext(os.path.basename(path))[0]
+        if _DIGEST.match(name):
+            return name
+        
+        # Files saved before the store existed are hashed on demand.
+        digest = hashlib.sha256()
+        with open(path, "rb") as f:
+            for chunk in iter(lambda: f.read(CHUNK_BYTES), b""):
+                digest.update(chunk)
+        return digest.hexdigest()
+    
+    def cached_skills(self, kind: str, digest: str) -> Optional[List[Dict]]:
+        try:
+            with open(self._extraction_path(kind, digest), "r") as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return None
+    
+    def cache_skills(self, kind: str, digest: str, skills: List[Dict]) -> None:
+        path = self._extraction_path(kind, digest)
+        os.makedirs(self.extractions_dir, exist_ok=True)
+        tmp_path = f"{path}.{uuid.uuid4().hex}.tmp"
+        with open(tmp_path, "w") as f:
+            json.dump(skills, f)
+        os.replace(tmp_path, path)
+    
+    def extract(self, kind: str, path: str, parse: Callable[[str], List[Dict]]) -> List[Dict]:
+        digest = self.digest_of(path)
+        skills = self.cached_skills(kind, digest)
+        if skills is not None:
+            return skills
+        
+        with self._lock(kind, digest):
+            skills = self.cached_skills(kind, digest)
+            if skills is None:
+                skills = parse(path)
+                self.cache_skills(kind, digest, skills)
+        return skills
+    
+    def _extraction_path(self, kind: str, digest: str) -> str:
+        return os.path.join(self.extractions_dir, f"{digest}.{kind}.v{extraction_version()}.json")
+    
+    @contextmanager
+    def _lock(self, kind: str, digest: str) -> Iterator[None]:
+        os.makedirs(self.extractions_dir, exist_ok=True)
+        path = os.path.join(self.extractions_dir, f"{digest}.{kind}.lock")
+        
+        while True:
+            lock_file = open(path, "a")
+            if not fcntl:
+                break
+            fcntl.flock(lock_file, fcntl.LOCK_EX)
+            # The holder before us may have removed the file after we opened
+            # it; a lock on that orphan excludes no one, so take a fresh one.
+            try:
+                if os.stat(path).st_ino == os.fstat(lock_file.fileno()).st_ino:
+                    break
+            except FileNotFoundError:
+                pass
+            lock_file.close()
+        
+        try:
+            yield
+        finally:
+            # Removed while still held, so lock files do not pile up.
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+            lock_file.close()
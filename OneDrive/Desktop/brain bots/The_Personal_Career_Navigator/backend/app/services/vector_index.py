@@ -0,0 +1,222 @@
+# backend/app/services/vector_index.py
+import argparse
+import json
+import os
+import threading
+from typing import Dict, List, Optional, Tuple
+import numpy as np
+from app.core.config import settings
+from app.services.embedding_service import EmbeddingService
+from app.services.job_snapshot import JobPostingsSnapshot
+
+try:
+    import hnswlib
+except ImportError:
+    hnswlib = None
+
+try:
+    import fcntl
+except ImportError:
+    fcntl = None
+
+ENCODE_BATCH_ROWS = 10000
+SEARCH_CHUNK_ROWS = 200000
+HNSW_M = 16
+HNSW_EF_CONSTRUCTION = 200
+HNSW_EF_SEARCH = 64
+
+_indexes: Dict[str, "PostingVectorIndex"] = {}
+_indexes_lock = threading.Lock()
+
+class PostingVectorIndex:
+    """On-disk nearest-neighbour index over job-description embeddings.
+
+    Normalized description vectors are appended to a float32 file whose
+    row number is the snapshot row id. When hnswlib is installed an HNSW
+    graph is kept next to it; otherwise searches fall back to a chunked
+    brute-force inner product over the memory-mapped vectors. Incremental
+    builds only embed appended rows, and only while the source CSV still
+    starts with the bytes the index was built from.
+    """
+
+    def __init__(self, directory: str = None, snapshot: JobPostingsSnapshot = None):
+        self.directory = directory or settings.VECTOR_INDEX_DIR
+        self.snapshot = snapshot or JobPostingsSnapshot()
+        self.embedding_service = EmbeddingService()
+
+        self.vectors_path = os.path.join(self.directory, "vectors.f32")
+        self.hnsw_path = os.path.join(self.directory, "hnsw.bin")
+        self.meta_path = os.path.join(self.directory, "meta.json")
+        self.lock_path = os.path.join(self.directory, "build.lock")
+
+        self.meta = self._read_meta()
+        self._vectors = None
+        self._hnsw = None
+
+    @property
+    def count(self) -> int:
+        return self.meta["count"] if self.meta else 0
+
+    def is_built(self) -> bool:
+        return self.count > 0
+
+    def version(self) -> str:
+        return _meta_version(self.directory)
+
+    def search(self, query: str, k: int = 10) -> List[Tuple[int, float]]:
+        if not self.is_built():
+            return []
+
+        query_vector = self.embedding_service.encode([query])[0].astype(np.float32)
+        k = min(k, self.count)
+
+        if self.meta.get("hnsw") and hnswlib is not None:
+            index = self._load_hnsw()
+            labels, distances = index.knn_query(query_vector, k=k)
+            return [(int(row), float(1 - d)) for row, d in zip(labels[0], distances[0])]
+
+        vectors = self._load_vectors()
+        best_rows = np.zeros(0, dtype=np.int64)
+        best_scores = np.zeros(0, dtype=np.float32)
+        for start in range(0, self.count, SEARCH_CHUNK_ROWS):
+            scores = vectors[start:start + SEARCH_CHUNK_ROWS] @ query_vector
+            top = np.argpartition(-scores, min(k, len(scores)) - 1)[:k]
+            best_rows = np.concatenate([best_rows, top + start])
+            best_scores = np.concatenate([best_scores, scores[top]])
+
+        order = np.argsort(-best_scores)[:k]
+        return [(int(best_rows[i]), float(best_scores[i])) for i in order]
+
+    def build(self, incremental: bool = True) -> Dict:
+        os.makedirs(self.directory, exist_ok=True)
+
+        with open(self.lock_path, "a") as lock_file:
+            if fcntl:
+                fcntl.flock(lock_file, fcntl.LOCK_EX)
+            try:
+                return self._build(incremental)
+            finally:
+                if fcntl:
+                    fcntl.flock(lock_file, fcntl.LOCK_UN)
+
+    def _build(self, incremental: bool) -> Dict:
+        table = self.snapshot.load()
+        self.meta = self._read_meta()
+
+        start = self.count if incremental else 0
+        if start > table.num_rows or not self.snapshot.extends(
+            (self.meta or {}).get("source_size"), (self.meta or {}).get("source_sha256")
+        ):
+            # Rows were edited or reordered, so stored row ids are stale.
+            start = 0
+
+        dim = self.embedding_service.model.get_sentence_embedding_dimension()
+        if start == 0:
+            for path in (self.vectors_path, self.hnsw_path):
+                if os.path.exists(path):
+                    os.remove(path)
+
+        index = None
+        if hnswlib is not None:
+            index = hnswlib.Index(space="ip", dim=dim)
+            if start and os.path.exists(self.hnsw_path):
+                index.load_index(self.hnsw_path, max_elements=table.num_rows)
+            else:
+                index.init_index(
+                    max_elements=max(table.num_rows, 1),
+                    ef_construction=HNSW_EF_CONSTRUCTION,
+                    M=HNSW_M
+                )
+                if start:
+                    existing = np.memmap(
+                        self.vectors_path, dtype=np.float32, mode="r", shape=(start, dim)
+                    )
+                    index.add_items(existing, np.arange(start))
+
+        descriptions = table.column("description") if "description" in table.column_names else None
+        with open(self.vectors_path, "ab") as f:
+            f.truncate(start * dim * 4)
+            for offset in range(start, table.num_rows, ENCODE_BATCH_ROWS):
+                end = min(offset + ENCODE_BATCH_ROWS, table.num_rows)
+                texts = (
+                    [d or "" for d in descriptions.slice(offset, end - offset).to_pylist()]
+                    if descriptions is not None else [""] * (end - offset)
+                )
+                vectors = self.embedding_service.encode(texts, use_cache=False).astype(np.float32)
+                f.write(vectors.tobytes())
+                if index is not None:
+                    index.add_items(vectors, np.arange(offset, end))
+            f.flush()
+            os.fsync(f.fileno())
+
+        if index is not None:
+            tmp_path = f"{self.hnsw_path}.tmp"
+            index.save_index(tmp_path)
+            os.replace(tmp_path, self.hnsw_path)
+
+        source = self.snapshot.source_info()
+        self.meta = {
+            "count": table.num_rows,
+            "dim": dim,
+            "hnsw": index is not None,
+            "dataset_version": self.snapshot.version(),
+            "source_size": source["size"],
+            "source_sha256": source["sha256"]
+        }
+        tmp_path = f"{self.meta_path}.tmp"
+        with open(tmp_path, "w") as f:
+            json.dump(self.meta, f)
+        os.replace(tmp_path, self.meta_path)
+
+        return {"incremental": start > 0, "added": table.num_rows - start, "count": table.num_rows}
+
+    def _load_vectors(self) -> np.memmap:
+        if self._vectors is None:
+            self._vectors = np.memmap(
+                self.vectors_path, dtype=np.float32, mode="r",
+                shape=(self.count, self.meta["dim"])
+            )
+        return self._vectors
+
+    def _load_hnsw(self):
+        if self._hnsw is None:
+            index = hnswlib.Index(space="ip", dim=self.meta["dim"])
+            index.load_index(self.hnsw_path)
+            index.set_ef(HNSW_EF_SEARCH)
+            self._hnsw = index
+        return self._hnsw
+
+    def _read_meta(self) -> Optional[Dict]:
+        try:
+            with open(self.meta_path, "r") as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return None
+
+def _meta_version(directory: str) -> str:
+    return f"{directory}:{os.stat(os.path.join(directory, 'meta.json')).st_mtime_ns}"
+
+def get_vector_index() -> Optional[PostingVectorIndex]:
+    try:
+        key = _meta_version(settings.VECTOR_INDEX_DIR)
+    except OSError:
+        return None
+
+    index = _indexes.get(key)
+    if index is None:
+        with _indexes_lock:
+            if key not in _indexes:
+                index = PostingVectorIndex()
+                if not index.is_built():
+                    return None
+                _indexes.clear()
+                _indexes[key] = index
+            index = _indexes[key]
+    return index
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Build the job-description vector index")
+    parser.add_argument("--full", action="store_true", help="re-embed every posting")
+    args = parser.parse_args()
+
+    print(PostingVectorIndex().build(incremental=not args.full))
@@ -5,16 +5,34 @@ from app.core.config import settings
 celery_app = Celery(
     "career_navigator",
     broker=settings.REDIS_URL,
-    backend=settings.REDIS_URL
+    backend=settings.REDIS_URL,
+    include=["app.tasks.scheduled_tasks", "app.tasks.roadmap_tasks", "app.tasks.extraction_tasks"]
 )
 
+celery_app.conf.task_track_started = True
+
+# Fail fast when Redis is down so request handlers can fall back quickly.
+celery_app.conf.result_backend_transport_options = {
+    "retry_policy": {"max_retries": 2, "interval_start": 0, "interval_step": 0.2}
+}
+
 celery_app.conf.task_routes = {
     "app.tasks.scheduled_tasks.*": {"queue": "scheduled"}
 }
 
 celery_app.conf.beat_schedule = {
+    # Hourly on purpose: each ISO week has one run, and later triggers are
+    # no-ops unless that run crashed or has failed chunks to resume.
     "weekly-evaluation": {
         "task": "app.tasks.scheduled_tasks.run_weekly_evaluation",
-        "schedule": 604800.0,
+        "schedule": 3600.0,
+    },
+    "daily-market-profiles": {
+        "task": "app.tasks.scheduled_tasks.build_market_profiles",
+        "schedule": 86400.0,
+    },
+    "daily-vector-index": {
+        "task": "app.tasks.scheduled_tasks.build_vector_index",
+        "schedule": 86400.0,
     }
 }
\ No newline at end of file
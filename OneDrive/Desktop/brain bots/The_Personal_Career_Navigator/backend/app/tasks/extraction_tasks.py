@@ -0,0 +1,8 @@
+# backend/app/tasks/extraction_tasks.py
+from app.core.config import settings
+from app.tasks.celery_app import celery_app
+from app.agents.orchestrator import extract_upload_skills
+
+@celery_app.task(time_limit=int(settings.PDF_TIMEOUT) + 30)
+def extract_upload(kind: str, path: str):
+    return {"kind": kind, "skills": len(extract_upload_skills(kind, path))}
@@ -0,0 +1,28 @@
+# backend/app/tasks/roadmap_tasks.py
+from app.core.config import settings
+from app.tasks.celery_app import celery_app
+from app.core.registry import registry
+from app.db.session import SessionLocal
+# Workers import no route module, so register the mapper User refers to.
+from app.models import evaluation  # noqa: F401
+
+@celery_app.task(
+    bind=True,
+    soft_time_limit=settings.ROADMAP_JOB_TIME_LIMIT,
+    time_limit=settings.ROADMAP_JOB_TIME_LIMIT + 30
+)
+def generate_roadmap_job(self, user_id: int, dream_role: str):
+    db = SessionLocal()
+    stages = {}
+    
+    def progress(stage, detail):
+        stages[stage] = detail
+        self.update_state(state="PROGRESS", meta={"stage": stage, "stages": dict(stages)})
+    
+    try:
+        orchestrator = registry.get_orchestrator()
+        result = orchestrator.run_full_pipeline(user_id, dream_role, db, progress=progress)
+        return {**result, "stages": stages}
+    
+    finally:
+        db.close()
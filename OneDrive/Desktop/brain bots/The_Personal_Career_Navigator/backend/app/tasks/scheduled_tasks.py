@@ -1,39 +1,212 @@
 # backend/app/tasks/scheduled_tasks.py
+from datetime import datetime, timedelta
+from typing import Dict, Iterator, List, Tuple
+from celery import chord, group
+from sqlalchemy import and_, exists, func, or_, select
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session
 from app.tasks.celery_app import celery_app
+from app.core.config import settings
 from app.db.session import SessionLocal
 from app.agents.evaluation_adaptation import EvaluationAdaptationAgent
 from app.models.user import User
-from app.models.evaluation import Evaluation
+from app.models.skill import Skill
+from app.models.roadmap import Roadmap
+from app.models.evaluation import Evaluation, EvaluationRun
+from app.services.market_profiles import MarketProfileBuilder
+from app.services.vector_index import PostingVectorIndex
 
 @celery_app.task
-def run_weekly_evaluation():
+def run_weekly_evaluation(chunk_size: int = None):
     db = SessionLocal()
     
     try:
-        users = db.query(User).all()
+        run = _current_run(db)
+        now = datetime.utcnow()
         
-        for user in users:
-            latest_eval = db.query(Evaluation).filter(
-                Evaluation.user_id == user.id
-            ).order_by(Evaluation.created_at.desc()).first()
-            
-            week_number = 1
-            if latest_eval:
-                week_number = latest_eval.week_number + 1
-            
-            agent = EvaluationAdaptationAgent()
-            evaluation = agent.evaluate_and_adapt(user.id, week_number, db)
-            
-            eval_record = Evaluation(
-                user_id=user.id,
-                week_number=week_number,
-                performance_score=evaluation.performance_score,
-                skills_updated=evaluation.skills_updated,
-                adaptations_made=evaluation.adaptations_made
-            )
-            db.add(eval_record)
+        if run.status == "completed":
+            return {"run": run.run_key, "status": run.status}
+        if run.dispatched_at and now - run.dispatched_at < timedelta(
+            seconds=settings.EVALUATION_RESUME_AFTER
+        ):
+            return {"run": run.run_key, "status": "in_progress"}
+        
+        chunks = list(_user_id_chunks(db, run.id, chunk_size or settings.EVALUATION_CHUNK_SIZE))
+        run.dispatched_at = now
+        db.commit()
+        run_id, run_key = run.id, run.run_key
+    
+    finally:
+        db.close()
+    
+    if not chunks:
+        return summarize_weekly_evaluation([], run_id)
+    
+    result = chord(
+        group(evaluate_user_chunk.s(run_id, first_id, last_id) for first_id, last_id in chunks)
+    )(summarize_weekly_evaluation.s(run_id))
+    
+    return {"run": run_key, "chunks": len(chunks), "summary_task_id": result.id}
+
+@celery_app.task(bind=True, max_retries=3, default_retry_delay=30)
+def evaluate_user_chunk(self, run_id: int, first_id: int, last_id: int):
+    db = SessionLocal()
+    
+    try:
+        result = _evaluate_users(db, run_id, first_id, last_id)
+        db.commit()
+        return result
+    
+    except Exception as e:
+        db.rollback()
+        if self.request.retries < self.max_retries:
+            raise self.retry(exc=e)
         
+        print(f"Error evaluating users {first_id}-{last_id}: {e}")
+        return {
+            "first_id": first_id,
+            "last_id": last_id,
+            "evaluated": 0,
+            "score_total": 0.0,
+            "error": str(e)
+        }
+    
+    finally:
+        db.close()
+
+@celery_app.task
+def summarize_weekly_evaluation(results: List[Dict], run_id: int):
+    evaluated = sum(r["evaluated"] for r in results)
+    failed = [[r["first_id"], r["last_id"]] for r in results if r.get("error")]
+    
+    db = SessionLocal()
+    
+    try:
+        run = db.query(EvaluationRun).filter(EvaluationRun.id == run_id).first()
+        run.users_evaluated = db.query(func.count(Evaluation.id)).filter(
+            Evaluation.run_id == run_id
+        ).scalar()
+        if failed:
+            # Leave the run open; the next beat resumes with the users still pending.
+            run.dispatched_at = None
+        else:
+            run.status = "completed"
+            run.finished_at = datetime.utcnow()
         db.commit()
+        
+        summary = {
+            "run": run.run_key,
+            "status": run.status,
+            "chunks": len(results),
+            "users_evaluated": evaluated,
+            "run_users_evaluated": run.users_evaluated,
+            "failed_chunks": failed,
+            "avg_performance_score": (
+                round(sum(r["score_total"] for r in results) / evaluated, 3) if evaluated else None
+            )
+        }
     
     finally:
-        db.close()
\ No newline at end of file
+        db.close()
+    
+    print(f"Weekly evaluation finished: {summary}")
+    
+    return summary
+
+def _current_run(db: Session) -> EvaluationRun:
+    run_key = datetime.utcnow().strftime("%G-W%V")
+    
+    run = db.query(EvaluationRun).filter(EvaluationRun.run_key == run_key).first()
+    if run is None:
+        try:
+            run = EvaluationRun(run_key=run_key)
+            db.add(run)
+            db.commit()
+        except IntegrityError:
+            db.rollback()
+            run = db.query(EvaluationRun).filter(EvaluationRun.run_key == run_key).one()
+    
+    return run
+
+def _needs_evaluation(run_id: int):
+    last_evaluated = select(func.max(Evaluation.created_at)).where(
+        Evaluation.user_id == User.id
+    ).correlate(User).scalar_subquery()
+    
+    return and_(
+        ~exists().where(Evaluation.user_id == User.id, Evaluation.run_id == run_id),
+        or_(
+            last_evaluated.is_(None),
+            User.updated_at > last_evaluated,
+            exists().where(Skill.user_id == User.id, Skill.updated_at > last_evaluated),
+            exists().where(Roadmap.user_id == User.id, Roadmap.created_at > last_evaluated)
+        )
+    )
+
+def _user_id_chunks(db: Session, run_id: int, chunk_size: int) -> Iterator[Tuple[int, int]]:
+    last_id = 0
+    
+    while True:
+        ids = [
+            row.id for row in db.query(User.id).filter(
+                User.id > last_id, _needs_evaluation(run_id)
+            ).order_by(User.id).limit(chunk_size)
+        ]
+        if not ids:
+            return
+        
+        yield ids[0], ids[-1]
+        last_id = ids[-1]
+
+def _evaluate_users(db: Session, run_id: int, first_id: int, last_id: int) -> Dict:
+    # Re-checked here so a retried or resumed chunk skips users it already finished.
+    user_ids = [
+        row.id for row in db.query(User.id).filter(
+            User.id.between(first_id, last_id), _needs_evaluation(run_id)
+        ).order_by(User.id)
+    ]
+    
+    latest_weeks = dict(
+        db.query(Evaluation.user_id, func.max(Evaluation.week_number)).filter(
+            Evaluation.user_id.between(first_id, last_id)
+        ).group_by(Evaluation.user_id).all()
+    )
+    
+    week_numbers = {user_id: (latest_weeks.get(user_id) or 0) + 1 for user_id in user_ids}
+    evaluations = EvaluationAdaptationAgent().evaluate_users(week_numbers, db)
+    evaluated_at = datetime.utcnow()
+    score_total = 0.0
+    
+    for user_id, evaluation in evaluations.items():
+        eval_record = Evaluation(
+            user_id=user_id,
+            run_id=run_id,
+            week_number=evaluation.week_number,
+            performance_score=evaluation.performance_score,
+            skills_updated=evaluation.skills_updated,
+            adaptations_made=evaluation.adaptations_made,
+            created_at=evaluated_at
+        )
+        db.add(eval_record)
+        score_total += evaluation.performance_score
+    
+    return {
+        "first_id": first_id,
+        "last_id": last_id,
+        "evaluated": len(user_ids),
+        "score_total": score_total
+    }
+
+@celery_app.task
+def build_market_profiles(incremental: bool = True):
+    db = SessionLocal()
+    
+    try:
+        return MarketProfileBuilder().run(db, incremental=incremental)
+    
+    finally:
+        db.close()
+
+@celery_app.task
+def build_vector_index(incremental: bool = True):
+    return PostingVectorIndex().build(incremental=incremental)
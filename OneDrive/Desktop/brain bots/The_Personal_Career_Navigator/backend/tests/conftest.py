@@ -0,0 +1,11 @@
+# backend/tests/conftest.py
+import os
+import sys
+
+os.environ.setdefault("DATABASE_URL", "sqlite:///./test.db")
+os.environ.setdefault("REDIS_URL", "")
+os.environ.setdefault("SECRET_KEY", "test")
+os.environ.setdefault("WARM_MODELS_ON_STARTUP", "false")
+os.environ.setdefault("GITHUB_CACHE_PATH", "")
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
@@ -0,0 +1,92 @@
+# backend/tests/github_stub.py
+import hashlib
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, List
+from urllib.parse import parse_qs, urlparse
+
+class GitHubStub:
+    """Local HTTP server answering the GitHub REST calls GitHubService makes.
+    
+    Serves paginated /users/{login}/repos with Link headers and ETags
+    (honouring If-None-Match with 304) and /repos/{login}/{repo}/languages.
+    rate_limits maps a path to Retry-After values returned with 429 before
+    the path starts succeeding.
+    """
+    
+    def __init__(self, repos: Dict[str, List[Dict]], languages: Dict[str, Dict], page_size: int = 2):
+        self.repos = repos
+        self.languages = languages
+        self.page_size = page_size
+        self.rate_limits: Dict[str, List[str]] = {}
+        self.requests: List[tuple] = []
+        self._server = ThreadingHTTPServer(("127.0.0.1", 0), self._handler())
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+    
+    @property
+    def url(self) -> str:
+        host, port = self._server.server_address
+        return f"http://{host}:{port}"
+    
+    def __enter__(self) -> "GitHubStub":
+        self._thread.start()
+        return self
+    
+    def __exit__(self, *exc) -> None:
+        self._server.shutdown()
+        self._server.server_close()
+    
+    def _handler(self):
+        stub = self
+        
+        class Handler(BaseHTTPRequestHandler):
+            def log_message(self, *args):
+                pass
+            
+            def do_GET(self):
+                parsed = urlparse(self.path)
+                query = parse_qs(parsed.query)
+                stub.requests.append((parsed.path, self.headers.get("If-None-Match")))
+                
+                pending = stub.rate_limits.get(parsed.path)
+                if pending:
+                    return self._send(429, b"{}", {"Retry-After": pending.pop(0)})
+                
+                parts = parsed.path.strip("/").split("/")
+                if len(parts) == 3 and parts[0] == "users" and parts[2] == "repos":
+                    return self._repos(parts[1], parsed.path, query)
+                if len(parts) == 4 and parts[0] == "repos" and parts[3] == "languages":
+                    return self._json(stub.languages.get(parts[2], {}))
+                self._send(404, b"{}")
+            
+            def _repos(self, login: str, path: str, query: Dict):
+                repos = stub.repos.get(login, [])
+                if query.get("sort") == ["pushed"]:
+                    repos = sorted(repos, key=lambda r: r["pushed_at"], reverse=True)
+                per_page = min(int(query.get("per_page", ["30"])[0]), stub.page_size)
+                page = int(query.get("page", ["1"])[0])
+                headers = {}
+                if page * per_page < len(repos):
+                    headers["Link"] = (
+                        f'<{stub.url}{path}?per_page={per_page}&page={page + 1}>; rel="next"'
+                    )
+                self._json(repos[(page - 1) * per_page:page * per_page], headers)
+            
+            def _json(self, payload, headers: Dict = None):
+                body = json.dumps(payload).encode()
+                etag = f'"{hashlib.sha1(body).hexdigest()}"'
+                if self.headers.get("If-None-Match") == etag:
+                    return self._send(304, b"", {"ETag": etag})
+                self._send(200, body, {**(headers or {}), "ETag": etag})
+            
+            def _send(self, status: int, body: bytes, headers: Dict = None):
+                self.send_response(status)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(body)))
+                for name, value in (headers or {}).items():
+                    self.send_header(name, value)
+                self.end_headers()
+                self.wfile.write(body)
+        
+        return Handler
@@ -0,0 +1,113 @@
+# backend/tests/test_github_service.py
+import asyncio
+import time
+from concurrent.futures import ThreadPoolExecutor
+from email.utils import formatdate
+import httpx
+import pytest
+from app.core import concurrency
+from app.services.github_service import GitHubService
+from app.services.http_cache import ConditionalResponseCache
+from tests.github_stub import GitHubStub
+
+REPOS = {
+    "octo": [
+        {"name": "api", "stargazers_count": 3, "updated_at": "2026-10-01T00:00:00Z", "pushed_at": "2026-10-01T00:00:00Z"},
+        {"name": "web", "stargazers_count": 1, "updated_at": "2026-09-01T00:00:00Z", "pushed_at": "2026-09-01T00:00:00Z"},
+        {"name": "ml", "stargazers_count": 0, "updated_at": "2025-01-01T00:00:00Z", "pushed_at": "2025-01-01T00:00:00Z"},
+    ]
+}
+LANGUAGES = {"api": {"Go": 100, "SQL": 5}, "web": {"TypeScript": 10}, "ml": {"Python": 50}}
+
+@pytest.fixture
+def stub():
+    with GitHubStub(REPOS, LANGUAGES) as server:
+        yield server
+
+def service(stub, cache=None) -> GitHubService:
+    return GitHubService(base_url=stub.url, token="", use_graphql=False, cache=cache)
+
+def test_extract_skills_follows_pagination(stub):
+    skills = service(stub).extract_skills("octo")
+    
+    assert sorted((s["skill"], s["evidence"]["repo"]) for s in skills) == [
+        ("Go", "api"), ("Python", "ml"), ("SQL", "api"), ("TypeScript", "web")
+    ]
+    assert [p for p, _ in stub.requests].count("/users/octo/repos") == 2
+
+@pytest.mark.parametrize("retry_after", ["0", formatdate(time.time() - 5, usegmt=True)])
+def test_rate_limited_requests_are_retried(stub, retry_after):
+    stub.rate_limits["/repos/octo/api/languages"] = [retry_after]
+    
+    skills = service(stub).extract_skills("octo")
+    
+    assert {"Go", "SQL"} <= {s["skill"] for s in skills}
+
+def test_rate_limit_delay_parses_http_dates():
+    future = formatdate(time.time() + 30, usegmt=True)
+    response = httpx.Response(429, headers={"retry-after": future})
+    
+    delay = GitHubService(token="")._rate_limit_delay(response)
+    
+    assert 25 <= delay <= 31
+    assert GitHubService(token="")._rate_limit_delay(
+        httpx.Response(429, headers={"retry-after": "soon"})
+    ) is None
+
+def test_cached_responses_are_revalidated(stub, tmp_path):
+    cache = ConditionalResponseCache(str(tmp_path / "github.sqlite3"), 1 << 20)
+    first = service(stub, cache).extract_skills("octo")
+    
+    second = service(stub, cache).extract_skills("octo")
+    
+    assert second == first
+    assert cache.revalidated == 5
+    assert all(etag for _, etag in stub.requests[-5:])
+
+def test_fingerprint_changes_when_a_repo_is_pushed(stub):
+    before = service(stub).fingerprint("octo")
+    stub.repos["octo"][2]["pushed_at"] = "2026-10-17T00:00:00Z"
+    
+    assert before and service(stub).fingerprint("octo") != before
+
+def test_sync_wrappers_work_inside_an_event_loop(stub):
+    async def call():
+        return service(stub).fingerprint("octo")
+    
+    assert asyncio.run(call())
+
+def test_cache_entries_are_scoped_to_the_token(stub, tmp_path):
+    cache = ConditionalResponseCache(str(tmp_path / "github.sqlite3"), 1 << 20)
+    GitHubService(base_url=stub.url, token="first", cache=cache).extract_skills("octo")
+    
+    GitHubService(base_url=stub.url, token="second", cache=cache).extract_skills("octo")
+    
+    assert cache.revalidated == 0
+    assert cache.stats()["entries"] == 10
+
+def test_invalidate_ignores_login_case(stub, tmp_path):
+    cache = ConditionalResponseCache(str(tmp_path / "github.sqlite3"), 1 << 20)
+    service(stub, cache).extract_skills("octo")
+    
+    service(stub, cache).invalidate("OCTO")
+    
+    assert cache.stats()["entries"] == 0
+
+def test_fingerprint_does_not_wait_on_the_blocking_pool(stub, tmp_path, monkeypatch):
+    # Pipelines call fingerprint from the shared pool; with one worker, cache
+    # I/O queued back onto that pool would never run.
+    monkeypatch.setattr(concurrency, "_executor", ThreadPoolExecutor(max_workers=1))
+    cache = ConditionalResponseCache(str(tmp_path / "github.sqlite3"), 1 << 20)
+    
+    async def call():
+        return await asyncio.wait_for(
+            concurrency.run_blocking(service(stub, cache).fingerprint, "octo"), timeout=10
+        )
+    
+    assert asyncio.run(call())
+
+def test_fingerprint_times_out(stub):
+    stub.rate_limits["/users/octo/repos"] = ["2"]
+    
+    with pytest.raises(asyncio.TimeoutError):
+        service(stub).fingerprint("octo", timeout=0.5)
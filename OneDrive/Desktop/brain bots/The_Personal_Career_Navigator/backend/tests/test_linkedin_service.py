@@ -0,0 +1,68 @@
+# backend/tests/test_linkedin_service.py
+import gzip
+import json
+import pytest
+from fastapi import HTTPException
+from app.api.routes_profile import check_linkedin_export
+from app.services.linkedin_service import LinkedInService, count_export_profiles
+
+PROFILE = {
+    "skills": [{"name": "Python", "endorsements": 10}, "SQL"],
+    "experience": [
+        {"company": "Acme", "title": "Analyst", "description": "Built reports in SQL and Python"}
+    ]
+}
+OTHER_PROFILE = {"skills": [{"name": "Java", "endorsements": 40}]}
+
+def write_json(path, *profiles):
+    path.write_text("\n".join(json.dumps(p) for p in profiles))
+    return str(path)
+
+def names(skills, source):
+    return [s["skill"] for s in skills if s["source"] == source]
+
+def test_listed_and_plain_string_skills(tmp_path):
+    skills = LinkedInService().extract_skills(write_json(tmp_path / "export.json", PROFILE))
+    
+    assert names(skills, "linkedin") == ["Python", "SQL"]
+    assert skills[0]["evidence"] == {"endorsements": 10, "level": 0.5}
+    assert skills[1]["evidence"]["endorsements"] == 0
+
+def test_experience_descriptions_are_matched(tmp_path):
+    skills = LinkedInService().extract_skills(write_json(tmp_path / "export.json", PROFILE))
+    experience = [s for s in skills if s["source"] == "linkedin_experience"]
+    
+    assert [s["skill"] for s in experience] == ["SQL", "Python"]
+    assert experience[0]["evidence"] == {"company": "Acme", "title": "Analyst"}
+
+def test_gzip_export_is_read(tmp_path):
+    path = tmp_path / "export.json.gz"
+    path.write_bytes(gzip.compress(json.dumps(PROFILE).encode()))
+    
+    skills = LinkedInService().extract_skills(str(path))
+    
+    assert names(skills, "linkedin") == ["Python", "SQL"]
+    assert count_export_profiles(str(path)) == 1
+
+def test_ndjson_export_uses_first_profile_only(tmp_path):
+    path = write_json(tmp_path / "export.ndjson", PROFILE, OTHER_PROFILE)
+    
+    skills = LinkedInService().extract_skills(path)
+    
+    assert "Java" not in names(skills, "linkedin")
+    assert count_export_profiles(path) == 2
+
+def test_upload_check_rejects_multiple_profiles(tmp_path):
+    check_linkedin_export(write_json(tmp_path / "one.json", PROFILE))
+    
+    with pytest.raises(HTTPException) as exc:
+        check_linkedin_export(write_json(tmp_path / "two.json", PROFILE, OTHER_PROFILE))
+    assert exc.value.status_code == 422
+
+def test_upload_check_rejects_invalid_json(tmp_path):
+    path = tmp_path / "broken.json"
+    path.write_text('{"skills": [')
+    
+    with pytest.raises(HTTPException) as exc:
+        check_linkedin_export(str(path))
+    assert exc.value.status_code == 422
@@ -0,0 +1,80 @@
+# backend/tests/test_pagination.py
+import asyncio
+from datetime import datetime, timedelta
+import pytest
+from fastapi import FastAPI, HTTPException, Response
+from fastapi.testclient import TestClient
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+from app.api import routes_evaluation
+from app.api.pagination import NEXT_CURSOR_HEADER, decode_cursor, encode_cursor, keyset_page
+from app.db.base import Base
+from app.db.session import get_async_db
+# Imported so every mapper and table is registered before create_all.
+from app.models import market_profile, pipeline_stage, roadmap, skill  # noqa: F401
+from app.models.evaluation import Evaluation
+from app.models.user import User
+
+START = datetime(2026, 10, 1, 12, 0, 0)
+
+@pytest.fixture
+def sessions(tmp_path):
+    engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'history.db'}")
+    
+    async def setup():
+        async with engine.begin() as conn:
+            await conn.run_sync(Base.metadata.create_all)
+        async with async_sessionmaker(engine)() as db:
+            db.add(User(id=1, email="a@example.com"))
+            # Pairs of rows share a timestamp, so pages must break ties on id.
+            db.add_all(
+                Evaluation(user_id=1, week_number=i, created_at=START + timedelta(days=i // 2))
+                for i in range(7)
+            )
+            await db.commit()
+    
+    asyncio.run(setup())
+    yield async_sessionmaker(engine, expire_on_commit=False)
+    asyncio.run(engine.dispose())
+
+def test_cursor_round_trip():
+    assert decode_cursor(encode_cursor(START, 42)) == (START, 42)
+
+@pytest.mark.parametrize("cursor", ["not-base64!", "bm8tc2VwYXJhdG9y", encode_cursor(START, 1)[:-4]])
+def test_invalid_cursor_is_rejected(cursor):
+    with pytest.raises(HTTPException) as raised:
+        decode_cursor(cursor)
+    
+    assert raised.value.status_code == 400
+
+def test_pages_cover_every_row_once_newest_first(sessions):
+    async def read_all():
+        weeks, cursor = [], None
+        async with sessions() as db:
+            while True:
+                response = Response()
+                page = await keyset_page(
+                    db, select(Evaluation).where(Evaluation.user_id == 1), Evaluation, cursor, 3, response
+                )
+                weeks.append([e.week_number for e in page])
+                cursor = response.headers.get(NEXT_CURSOR_HEADER)
+                if cursor is None:
+                    return weeks
+    
+    assert asyncio.run(read_all()) == [[6, 5, 4], [3, 2, 1], [0]]
+
+def test_history_route_returns_400_for_a_bad_cursor(sessions):
+    app = FastAPI()
+    app.include_router(routes_evaluation.router)
+    
+    async def db_override():
+        async with sessions() as db:
+            yield db
+    app.dependency_overrides[get_async_db] = db_override
+    client = TestClient(app)
+    
+    first = client.get("/evaluation/1", params={"limit": 4})
+    second = client.get("/evaluation/1", params={"limit": 4, "cursor": first.headers[NEXT_CURSOR_HEADER]})
+    
+    assert [e["week_number"] for e in first.json() + second.json()] == [6, 5, 4, 3, 2, 1, 0]
+    assert client.get("/evaluation/1", params={"cursor": "garbage"}).status_code == 400
@@ -0,0 +1,32 @@
+# backend/tests/test_skill_matcher.py
+import pytest
+from app.services.skill_matcher import SKILL_TAXONOMY, SkillMatcher
+
+@pytest.fixture(scope="module")
+def matcher():
+    return SkillMatcher(SKILL_TAXONOMY)
+
+@pytest.mark.parametrize("text", [
+    "Led R&D for the payments team",
+    "Reported R-squared values",
+    "Worked in r&d",
+])
+def test_single_letter_names_need_a_clean_boundary(matcher, text):
+    assert "R" not in matcher.find(text)
+
+@pytest.mark.parametrize("text", [
+    "Analysis in R.",
+    "Python, R and SQL",
+    "Tools: Python/R",
+    "(R)",
+])
+def test_single_letter_names_match_on_their_own(matcher, text):
+    assert "R" in matcher.find(text)
+
+def test_matches_respect_word_boundaries(matcher):
+    found = matcher.find("A good gopher wrote Go, C++ and k8s-based services on Java")
+    
+    assert found == ["Go", "C++", "Kubernetes", "Java"]
+
+def test_words_containing_a_skill_do_not_match(matcher):
+    assert matcher.find("Javascripted pythonic gitlab goal") == []
@@ -0,0 +1,63 @@
+# backend/tests/test_skill_store.py
+import re
+import pytest
+from sqlalchemy import create_engine, text
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.schema import CreateTable
+from app.db.base import Base
+# Imported so every mapper and table is registered before create_all.
+from app.models import evaluation, market_profile, pipeline_stage, roadmap  # noqa: F401
+from app.models.skill import Skill
+from app.models.user import User
+from app.schemas.skill import SkillGap
+from app.services import skill_store
+
+def session_for(tmp_path, unique: bool):
+    engine = create_engine(f"sqlite:///{tmp_path / 'skills.db'}")
+    if unique:
+        Base.metadata.create_all(engine)
+    else:
+        # A database created before uq_skills_user_skill existed.
+        Base.metadata.create_all(engine, tables=[t for t in Base.metadata.sorted_tables if t.name != "skills"])
+        ddl = str(CreateTable(Skill.__table__).compile(engine))
+        ddl = re.sub(r",\s*CONSTRAINT uq_skills_user_skill UNIQUE \([^)]*\)", "", ddl)
+        with engine.begin() as conn:
+            conn.execute(text(ddl))
+    
+    db = sessionmaker(bind=engine, autoflush=False)()
+    db.add(User(id=1, email="a@example.com"))
+    db.commit()
+    return db
+
+def gaps(level: float):
+    return [
+        SkillGap(skill="Python", importance=0.9, user_level=level, gap_score=0.9 * (1 - level)),
+        SkillGap(skill="SQL", importance=0.5, user_level=0.2, gap_score=0.4)
+    ]
+
+@pytest.fixture(autouse=True)
+def fresh_conflict_targets(monkeypatch):
+    monkeypatch.setattr(skill_store, "_conflict_targets", {})
+
+@pytest.mark.parametrize("unique", [True, False])
+def test_upsert_updates_existing_rows(tmp_path, unique):
+    db = session_for(tmp_path, unique)
+    skill_store.upsert_skill_gaps(db, 1, gaps(0.1), {"Python": {"evidence": [{"source": "resume"}]}})
+    db.commit()
+    
+    skill_store.upsert_skill_gaps(db, 1, gaps(0.6), {})
+    db.commit()
+    
+    rows = {s.skill_name: s for s in db.query(Skill).filter(Skill.user_id == 1)}
+    assert sorted(rows) == ["Python", "SQL"]
+    assert rows["Python"].user_level == pytest.approx(0.6)
+    assert rows["Python"].evidence == [{"source": "resume"}]
+    assert list(skill_store._conflict_targets.values()) == [unique]
+
+def test_upsert_stays_in_the_callers_transaction(tmp_path):
+    db = session_for(tmp_path, unique=True)
+    
+    skill_store.upsert_skill_gaps(db, 1, gaps(0.1), {})
+    db.rollback()
+    
+    assert db.query(Skill).count() == 0
@@ -0,0 +1,44 @@
+# backend/tests/test_title_index.py
+import numpy as np
+import pyarrow as pa
+import pytest
+from app.services.title_index import TitleIndex, normalize_title
+
+TITLES = [
+    "Machine Learning Engineer",
+    "Data Scientist",
+    "Senior Software Engineer",
+    "Machine Learning Engineer",
+    "Sales Manager",
+    "Sr. ML Engineer, Platform",
+]
+
+@pytest.fixture(scope="module")
+def index():
+    return TitleIndex(pa.chunked_array([TITLES[:3], TITLES[3:] + [None]]))
+
+def test_aliases_expand_to_full_words():
+    assert normalize_title("Sr. ML Engineer") == ["senior", "machine", "learning", "engineer"]
+    assert normalize_title("Full-Stack Dev") == ["full", "stack", "developer"]
+
+def test_alias_query_finds_the_spelled_out_title(index):
+    rows = index.search("ML Engineer")
+    
+    assert sorted(rows[:2]) == [0, 3]
+    assert set(rows) <= {0, 3, 5}
+    assert 5 in rows
+
+def test_similar_tokens_match(index):
+    assert index.search("data scientists")[0] == 1
+
+def test_unrelated_query_finds_nothing(index):
+    assert len(index.search("astronaut")) == 0
+
+def test_saved_index_loads_with_matching_version_only(index, tmp_path):
+    path = str(tmp_path / "titles.npz")
+    index.save(path, "v1")
+    
+    loaded = TitleIndex.load(path, "v1")
+    
+    assert np.array_equal(loaded.search("ML Engineer"), index.search("ML Engineer"))
+    assert TitleIndex.load(path, "v2") is None